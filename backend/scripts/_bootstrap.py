@@ -0,0 +1,15 @@
+"""
+Shared sys.path bootstrap for the helper scripts.
+
+Importing this module puts the backend directory on sys.path exactly once,
+so every script resolves `src.*` under the same module name (avoiding the
+double-import traps that silently defeat module-level caches).
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
@@ -4,15 +4,14 @@ Quick script to check scheduler status and test one run
 """
 
 import os
-import sys
+import traceback
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
 load_dotenv()
 
-from src.tx_sender import get_cached_client, list_registered_symbols, check_contract_health
+from src.tx_sender import get_cached_client, list_registered_symbols
 from src.scheduler import run_once
 
 def main():
@@ -42,41 +41,31 @@ def main():
         print("\n❌ ERROR: PRIVATE_KEY not set in .env")
         return
     
-    # Check contract health
-    print("\n2. Contract Health Check:")
+    # Health check and symbol list share one read: a successful
+    # list_symbols call proves the contract is reachable, so there is no
+    # need for a separate check_contract_health round-trip
+    print("\n2. Contract Health Check + Symbols:")
     try:
         client, contract_address, account = get_cached_client()
-        if check_contract_health(client, contract_address):
-            print("   ✅ Contract is healthy")
-        else:
-            print("   ❌ Contract health check failed")
-            return
-    except Exception as e:
-        print(f"   ❌ Error connecting to contract: {e}")
-        return
-    
-    # List symbols
-    print("\n3. Symbols in Contract:")
-    try:
         symbols = list_registered_symbols(client, contract_address)
+        print("   ✅ Contract is healthy")
         if symbols:
             print(f"   Found {len(symbols)} symbols: {', '.join(symbols)}")
         else:
             print("   ⚠️  No symbols found in contract. Add symbols via frontend first.")
             return
     except Exception as e:
-        print(f"   ❌ Error fetching symbols: {e}")
+        print(f"   ❌ Error connecting to contract: {e}")
         return
     
     # Test run
-    print("\n4. Testing Scheduler Run:")
+    print("\n3. Testing Scheduler Run:")
     print("   Running run_once()...")
     try:
         run_once()
         print("   ✅ Scheduler run completed (check logs above for details)")
     except Exception as e:
         print(f"   ❌ Error during scheduler run: {e}")
-        import traceback
         traceback.print_exc()
     
     print("\n" + "=" * 60)
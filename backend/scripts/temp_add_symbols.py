@@ -4,71 +4,101 @@ Temporary helper script to add popular symbols and submit predictions for all ti
 Delete this file after use.
 """
 
-import sys
-import time
-from pathlib import Path
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
-from dotenv import load_dotenv
+from src.timeframes import TIMEFRAMES
 
-from src.context_builder import build_market_context
-from src.tx_sender import (
-    add_symbol,
-    initialise_client,
-    submit_prediction_update,
-)
-
-TIMEFRAMES = ["1h", "4h", "12h", "24h", "7d", "30d"]
 DEFAULT_SYMBOLS = ["ETH", "XRP", "DOGE", "SOL", "BNB"]
 
 
-def main():
-    load_dotenv()
+def process_symbol(client, contract_address: str, symbol: str) -> None:
+    # Lazy imports: resolved from sys.modules after the first call
+    from src.context_builder import build_market_context
+    from src.tx_sender import SymbolAlreadyExistsError, add_symbol, submit_prediction_update
 
-    symbols = [arg.upper() for arg in sys.argv[1:]] or DEFAULT_SYMBOLS
+    print(f"\n=== Processing {symbol} ===")
+    try:
+        tx_hash, _ = add_symbol(
+            client,
+            contract_address,
+            symbol,
+            f"{symbol} auto-added by temp script",
+        )
+        print(f"[{symbol}] Add symbol TX: {tx_hash}")
+    except SymbolAlreadyExistsError:
+        print(f"[{symbol}] already registered, continuing...")
+    except Exception as exc:
+        print(f"[{symbol}] Failed to add: {exc}")
+        return
 
-    client, contract_address, account = initialise_client()
-    print(f"Using contract: {contract_address}")
+    try:
+        context = build_market_context(symbol)
+        print(f"[{symbol}] Context generated ({len(context)} chars)")
+    except Exception as exc:
+        print(f"[{symbol}] Failed to build context: {exc}")
+        return
 
-    for symbol in symbols:
-        print(f"\n=== Processing {symbol} ===")
-        try:
-            tx_hash, _ = add_symbol(
+    # Timeframe submissions are independent, so fan them out in parallel
+    # instead of serializing six RPC round-trips with sleeps in between
+    with ThreadPoolExecutor(max_workers=len(TIMEFRAMES)) as executor:
+        future_to_timeframe = {
+            executor.submit(
+                submit_prediction_update,
                 client,
                 contract_address,
                 symbol,
-                f"{symbol} auto-added by temp script",
-            )
-            print(f"Add symbol TX: {tx_hash}")
-        except Exception as exc:
-            if "symbol already exists" in str(exc).lower():
-                print(f"{symbol} already registered, continuing...")
-            else:
-                print(f"Failed to add {symbol}: {exc}")
-                continue
-
-        try:
-            context = build_market_context(symbol)
-            print(f"Context generated ({len(context)} chars)")
-        except Exception as exc:
-            print(f"Failed to build context for {symbol}: {exc}")
-            continue
-
-        for timeframe in TIMEFRAMES:
+                context,
+                timeframe,
+            ): timeframe
+            for timeframe in TIMEFRAMES
+        }
+        for future in as_completed(future_to_timeframe):
+            timeframe = future_to_timeframe[future]
+            try:
+                tx_hash, _ = future.result()
+                print(f"[{symbol} {timeframe}] prediction submitted (tx {tx_hash[:16]}...)")
+            except Exception as exc:
+                print(f"[{symbol} {timeframe}] submission failed: {exc}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add symbols and submit predictions for all timeframes."
+    )
+    parser.add_argument(
+        'symbols',
+        nargs='*',
+        help=f"symbols to process (default: {' '.join(DEFAULT_SYMBOLS)})",
+    )
+    args = parser.parse_args()
+
+    # Heavy imports happen after arg parsing so --help stays instant
+    from dotenv import load_dotenv
+    from src.tx_sender import get_cached_client
+
+    load_dotenv()
+
+    symbols = [arg.upper() for arg in args.symbols] or DEFAULT_SYMBOLS
+
+    client, contract_address, account = get_cached_client()
+    print(f"Using contract: {contract_address}")
+
+    # Symbols are independent too, so fan them out across a second pool;
+    # the shared pooled client keeps one HTTP session across all workers
+    with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+        futures = {
+            executor.submit(process_symbol, client, contract_address, symbol): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
             try:
-                tx_hash, _ = submit_prediction_update(
-                    client,
-                    contract_address,
-                    symbol,
-                    context,
-                    timeframe,
-                )
-                print(f"[{timeframe}] prediction submitted (tx {tx_hash[:16]}...)")
-                if timeframe != TIMEFRAMES[-1]:
-                    time.sleep(1)
+                future.result()
             except Exception as exc:
-                print(f"[{timeframe}] submission failed: {exc}")
+                print(f"[{symbol}] processing failed: {exc}")
 
 
 if __name__ == "__main__":
@@ -4,36 +4,36 @@ Test script to manually submit predictions for all timeframes for a symbol.
 This can be used to test the multi-timeframe functionality immediately.
 """
 
-import os
+import argparse
 import sys
-import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
-from dotenv import load_dotenv
-from src.context_builder import build_market_context
-from src.tx_sender import initialise_client, submit_prediction_update
+from src.timeframes import TIMEFRAMES
 
-load_dotenv()
+def main():
+    parser = argparse.ArgumentParser(
+        description="Submit predictions for every timeframe of one symbol."
+    )
+    parser.add_argument('symbol', help="symbol to test, e.g. BTC")
+    args = parser.parse_args()
 
-TIMEFRAMES = ["1h", "4h", "12h", "24h", "7d", "30d"]
+    # Heavy imports happen after arg parsing so --help stays instant
+    from dotenv import load_dotenv
+    from src.context_builder import build_market_context
+    from src.tx_sender import get_cached_client, submit_prediction_update
+
+    load_dotenv()
+
+    symbol = args.symbol.upper()
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python test_all_timeframes.py <SYMBOL>")
-        print("Example: python test_all_timeframes.py BTC")
-        sys.exit(1)
-    
-    symbol = sys.argv[1].upper()
-    
     print(f"Testing multi-timeframe predictions for {symbol}")
     print("=" * 60)
     
     # Initialize client
     try:
-        client, contract_address, account = initialise_client()
+        client, contract_address, account = get_cached_client()
         print(f"[OK] Connected to contract: {contract_address}")
     except Exception as e:
         print(f"[ERROR] Failed to initialize client: {e}")
@@ -48,30 +48,33 @@ def main():
         print(f"[ERROR] Failed to build context: {e}")
         sys.exit(1)
     
-    # Submit for each timeframe
-    print(f"\nSubmitting predictions for all timeframes...")
+    # Submit all timeframes in parallel - the calls are independent, so this
+    # turns six sequential RPC round-trips (plus delays) into one fan-out
+    print(f"\nSubmitting predictions for all timeframes (parallel)...")
     print("-" * 60)
-    
+
     results = {}
-    for timeframe in TIMEFRAMES:
-        try:
-            print(f"\n[{timeframe}] Submitting...", end=" ", flush=True)
-            tx_hash, receipt_id = submit_prediction_update(
-                client, 
-                contract_address, 
-                symbol, 
-                context, 
+    with ThreadPoolExecutor(max_workers=len(TIMEFRAMES)) as executor:
+        future_to_timeframe = {
+            executor.submit(
+                submit_prediction_update,
+                client,
+                contract_address,
+                symbol,
+                context,
                 timeframe
-            )
-            results[timeframe] = {"success": True, "tx_hash": tx_hash}
-            print(f"[OK] Success! TX: {tx_hash[:16]}...")
-            
-            # Small delay between timeframes
-            if timeframe != TIMEFRAMES[-1]:
-                time.sleep(2)
-        except Exception as e:
-            results[timeframe] = {"success": False, "error": str(e)}
-            print(f"[ERROR] Failed: {e}")
+            ): timeframe
+            for timeframe in TIMEFRAMES
+        }
+        # Collect quietly; the summary below renders everything in one pass
+        # instead of interleaving per-future prints from worker threads
+        for future in as_completed(future_to_timeframe):
+            timeframe = future_to_timeframe[future]
+            try:
+                tx_hash, receipt_id = future.result()
+                results[timeframe] = {"success": True, "tx_hash": tx_hash}
+            except Exception as e:
+                results[timeframe] = {"success": False, "error": str(e)}
     
     # Summary
     print("\n" + "=" * 60)
@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 """Test Binance API fetching for SOL"""
-import sys
-import os
 import json
+import traceback
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
 from src.context_builder import _fetch_price_binance, _fetch_ohlc_binance, build_market_context
 
@@ -67,7 +66,6 @@ def main():
         
     except Exception as e:
         print(f"[ERROR] Context build failed: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == '__main__':
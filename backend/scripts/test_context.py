@@ -2,26 +2,32 @@
 """
 Test script để kiểm tra context builder và xem output JSON
 """
+import asyncio
 import json
 import sys
-import os
+import traceback
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
-from src.context_builder import build_market_context
+from src.context_builder import build_market_context_async
 
-def main():
-    import time
+async def main_async():
     symbols = ['BTC', 'ETH']
-    
-    for symbol in symbols:
+
+    # Build all contexts concurrently instead of one symbol at a time
+    contexts = await asyncio.gather(
+        *(build_market_context_async(symbol) for symbol in symbols),
+        return_exceptions=True,
+    )
+
+    for symbol, context_json in zip(symbols, contexts):
         print(f"\n{'='*60}")
         print(f"Testing context builder for {symbol}")
         print(f"{'='*60}\n")
-        
+
         try:
-            context_json = build_market_context(symbol)
+            if isinstance(context_json, BaseException):
+                raise context_json
             context_dict = json.loads(context_json)
             
             # Summary
@@ -60,13 +66,10 @@ def main():
             
         except Exception as e:
             print(f"[ERROR] Error for {symbol}: {e}", file=sys.stderr)
-            import traceback
             traceback.print_exc()
-        
-        # Delay to avoid rate limiting
-        if symbol != symbols[-1]:
-            print(f"\nWaiting 2 seconds to avoid rate limits...")
-            time.sleep(2)
+
+def main():
+    asyncio.run(main_async())
 
 if __name__ == '__main__':
     main()
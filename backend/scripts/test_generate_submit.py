@@ -4,12 +4,13 @@ import os
 import sys
 import json
 import logging
+import traceback
 from dotenv import load_dotenv
 
-# Change to backend directory for proper imports
-backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-os.chdir(backend_dir)
-sys.path.insert(0, backend_dir)
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
+
+# Run from the backend directory so .env discovery is unchanged
+os.chdir(_bootstrap.BACKEND_DIR)
 
 load_dotenv()
 
@@ -53,7 +54,6 @@ def test_generate_context():
         return context
     except Exception as e:
         print(f"\n[ERROR] Failed to generate context: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -64,13 +64,13 @@ def test_submit_prediction(context_json: str):
     print("=" * 60)
     
     try:
-        from src.tx_sender import initialise_client, submit_prediction_update
-        
+        from src.tx_sender import get_cached_client, submit_prediction_update
+
         symbol = "BTC"
         timeframe = "24h"
-        
+
         print(f"\nInitializing client...")
-        client, contract_address, account = initialise_client()
+        client, contract_address, account = get_cached_client()
         print(f"[OK] Connected to contract: {contract_address}")
         print(f"[OK] Account: {account.address}")
         
@@ -90,7 +90,6 @@ def test_submit_prediction(context_json: str):
         return True
     except Exception as e:
         print(f"\n[ERROR] Failed to submit prediction: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -98,6 +97,11 @@ def main():
     print("\n" + "=" * 60)
     print("TEST: Generate Context & Submit Prediction")
     print("=" * 60)
+
+    # Pass --fresh-client to force a new client instead of the pooled one
+    if '--fresh-client' in sys.argv:
+        from src.tx_sender import clear_client_cache
+        clear_client_cache()
     
     # Step 1: Generate context
     context = test_generate_context()
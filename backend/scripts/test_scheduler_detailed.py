@@ -4,12 +4,13 @@ import os
 import sys
 import json
 import logging
+import traceback
 from dotenv import load_dotenv
 
-# Change to backend directory for proper imports
-backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-os.chdir(backend_dir)
-sys.path.insert(0, backend_dir)
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
+
+# Run from the backend directory so .env discovery is unchanged
+os.chdir(_bootstrap.BACKEND_DIR)
 
 load_dotenv()
 
@@ -67,12 +68,9 @@ def test_interval_config():
     # Test default
     if 'UPDATE_INTERVAL_SECONDS' in os.environ:
         del os.environ['UPDATE_INTERVAL_SECONDS']
-    from src.scheduler import main
-    import importlib
-    import src.scheduler as scheduler_module
-    importlib.reload(scheduler_module)
-    
-    # This is tricky to test without running main(), so just check env reading
+
+    # src.scheduler reads UPDATE_INTERVAL_SECONDS inside main(), not at import
+    # time, so no module reload is needed - just check the env reading logic
     interval = int(os.getenv('UPDATE_INTERVAL_SECONDS', '900'))
     print(f"Default interval: {interval} seconds ({interval/60:.1f} minutes)")
     assert interval == 900, "Default should be 900 seconds"
@@ -91,7 +89,7 @@ def test_timeframes():
     print("TEST 3: Timeframes")
     print("=" * 60)
     
-    TIMEFRAMES = ["1h", "4h", "12h", "24h", "7d", "30d"]
+    from src.timeframes import TIMEFRAMES
     print(f"Timeframes: {TIMEFRAMES}")
     print(f"Total timeframes: {len(TIMEFRAMES)}")
     
@@ -168,7 +166,6 @@ def main():
         
     except Exception as e:
         print(f"\n[FAILED] Test error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Test script to verify scheduler interval configuration"""
 import os
-import sys
+import threading
 import time
+import traceback
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
 load_dotenv()
 
@@ -32,16 +32,23 @@ try:
         print(f"[TEST] Scheduled job executed at {time.strftime('%H:%M:%S')}")
     
     schedule.every(test_interval).seconds.do(test_job)
-    
+
     print(f"Scheduler configured to run every {test_interval} seconds (test mode)")
     print(f"Waiting {test_interval + 3} seconds to verify scheduler execution...")
-    
-    # Run for test_interval + 3 seconds to allow the job to execute
+
+    # Sleep until the next scheduled run instead of polling every second:
+    # one wakeup per job rather than one per second, and no 1s jitter
     start_time = time.time()
     test_duration = test_interval + 3
+    wakeup = threading.Event()
     while time.time() - start_time < test_duration:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break
+        if idle > 0:
+            remaining = test_duration - (time.time() - start_time)
+            wakeup.wait(min(idle, max(remaining, 0)))
         schedule.run_pending()
-        time.sleep(1)
     
     if job_executed[0]:
         print(f"[SUCCESS] Test completed. Scheduled job executed successfully!")
@@ -52,6 +59,5 @@ try:
     
 except Exception as e:
     print(f"Error: {e}")
-    import traceback
     traceback.print_exc()
 
@@ -2,11 +2,10 @@
 """
 Test script để chạy scheduler một lần (không loop) để kiểm tra
 """
-import sys
-import os
+import traceback
 from dotenv import load_dotenv
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
 
 from src.scheduler import run_once
 
@@ -21,6 +20,5 @@ if __name__ == '__main__':
     except Exception as e:
         print("=" * 60)
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
 
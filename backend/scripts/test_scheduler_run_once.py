@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 """Test script to manually run scheduler.run_once() and check for errors"""
 import os
-import sys
 import logging
+import traceback
 from dotenv import load_dotenv
 
-# Change to backend directory for proper imports
-backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-os.chdir(backend_dir)
-sys.path.insert(0, backend_dir)
+import _bootstrap  # noqa: F401  (puts the backend dir on sys.path)
+
+# Run from the backend directory so .env discovery is unchanged
+os.chdir(_bootstrap.BACKEND_DIR)
 
 load_dotenv()
 
@@ -32,6 +32,5 @@ try:
     
 except Exception as e:
     print(f"ERROR: {e}")
-    import traceback
     traceback.print_exc()
 
@@ -1,10 +1,79 @@
+import asyncio
+import functools
 import json
 import os
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 import httpx
+import numpy as np
+
+from .indicators import compute_indicators
+
+# Prefer orjson (C-accelerated) for the JSON hot paths; fall back to stdlib
+# json so the module still works without the optional dependency
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+    _json_loads = json.loads
+
+# Context caching so repeated builds for the same symbol (e.g. across
+# scheduler runs or timeframes) reuse recent market data instead of
+# re-hitting the Binance/CoinGecko/news APIs
+_context_cache: Dict[str, tuple] = {}
+_context_cache_lock = threading.Lock()
+CONTEXT_CACHE_TTL = int(os.getenv('CONTEXT_CACHE_TTL_SECONDS', '60'))
+
+# Per-helper TTLs: spot prices go stale fastest, OHLC candles update hourly,
+# and the news feed barely changes between scheduler runs
+PRICE_CACHE_TTL = int(os.getenv('PRICE_CACHE_TTL_SECONDS', '15'))
+OHLC_CACHE_TTL = int(os.getenv('OHLC_CACHE_TTL_SECONDS', '60'))
+NEWS_CACHE_TTL = int(os.getenv('NEWS_CACHE_TTL_SECONDS', '300'))
+
+# Caches created by _ttl_cached, tracked so clear_context_cache can wipe them
+_fetch_caches: list = []
+
+
+def _ttl_cached(ttl_seconds: float):
+    """
+    Memoize a fetch helper by its arguments for ttl_seconds.
+
+    The same ticker/klines/news request is otherwise re-issued for every
+    timeframe of a symbol within one scheduler cycle. Error payloads (dicts
+    carrying an 'error' key) are never cached, so transient upstream failures
+    are retried on the next call instead of being pinned for the full TTL.
+    """
+    def decorator(func):
+        cache: Dict[tuple, tuple] = {}
+        lock = threading.Lock()
+        _fetch_caches.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and time.time() - hit[1] < ttl_seconds:
+                    return hit[0]
+            result = func(*args, **kwargs)
+            if not (isinstance(result, dict) and 'error' in result):
+                with lock:
+                    cache[key] = (result, time.time())
+            return result
+        return wrapper
+    return decorator
 
 # Binance API endpoints (use first available)
 BINANCE_BASE_URLS = [
@@ -37,8 +106,134 @@ COINGECKO_IDS = {
     'XRP': 'ripple',
 }
 
+# Coin mentions that disqualify an item from the "general market news"
+# fallback in _fetch_macro_headlines (unless they refer to the symbol itself)
+GENERAL_NEWS_TERMS = ['BTC', 'ETH', 'SOL', 'AVAX', 'ARB', 'DOGE', 'bitcoin', 'ethereum', 'solana', 'avalanche', 'arbitrum', 'dogecoin']
+
+# Map symbol to common names in news
+SYMBOL_NEWS_NAMES = {
+    'BTC': ['bitcoin', 'BTC', 'Bitcoin'],
+    'ETH': ['ethereum', 'ETH', 'Ethereum'],
+    'SOL': ['solana', 'SOL', 'Solana'],
+    'AVAX': ['avalanche', 'AVAX', 'Avalanche'],
+    'ARB': ['arbitrum', 'ARB', 'Arbitrum'],
+    'DOGE': ['dogecoin', 'DOGE', 'Dogecoin', 'doge'],
+    'MATIC': ['polygon', 'MATIC', 'Polygon', 'matic'],
+    'LINK': ['chainlink', 'LINK', 'Chainlink'],
+    'ADA': ['cardano', 'ADA', 'Cardano'],
+    'DOT': ['polkadot', 'DOT', 'Polkadot'],
+    'UNI': ['uniswap', 'UNI', 'Uniswap'],
+    'ATOM': ['cosmos', 'ATOM', 'Cosmos'],
+    'XRP': ['ripple', 'XRP', 'Ripple', 'xrp'],
+    'BNB': ['binance', 'BNB', 'Binance Coin', 'binance coin'],
+    'LTC': ['litecoin', 'LTC', 'Litecoin'],
+    'BCH': ['bitcoin cash', 'BCH', 'Bitcoin Cash'],
+}
+
+# Compiled (symbol_re, other_coin_re) pairs per symbol; the term lists are
+# deterministic per symbol so each pattern only needs to be built once
+_news_pattern_cache: Dict[str, tuple] = {}
+
+
+def _news_patterns(symbol_upper: str, symbol_lower: str) -> tuple:
+    """Return the compiled (symbol_re, other_coin_re) pair for a symbol."""
+    cached = _news_pattern_cache.get(symbol_upper)
+    if cached is not None:
+        return cached
+
+    # Get additional search terms for the symbol
+    if symbol_upper in SYMBOL_NEWS_NAMES:
+        search_terms = SYMBOL_NEWS_NAMES[symbol_upper].copy()
+    else:
+        # For new symbols, try to infer coin name from symbol
+        # Common patterns: symbol is often the coin name or abbreviation
+        search_terms = [symbol_upper, symbol_lower]
+        # Try to find coin name from CoinGecko ID if available
+        cg_id = COINGECKO_IDS.get(symbol_upper)
+        if cg_id:
+            # Convert CoinGecko ID to readable name (e.g., 'avalanche-2' -> 'avalanche')
+            coin_name = cg_id.replace('-2', '').replace('-', ' ')
+            search_terms.extend([coin_name, coin_name.title(), coin_name.upper()])
+
+    # Symbol name variations for filtering
+    search_terms.extend([symbol_upper, symbol_lower, symbol_upper + 'USD', symbol_upper + '/USD'])
+
+    # One case-insensitive alternation matches every search term in a
+    # single C-level scan instead of len(items) x len(terms) substring checks
+    symbol_re = re.compile('|'.join(re.escape(term) for term in search_terms), re.IGNORECASE)
+    other_coin_re = re.compile(
+        '|'.join(re.escape(term) for term in GENERAL_NEWS_TERMS if term.upper() != symbol_upper),
+        re.IGNORECASE,
+    )
+    _news_pattern_cache[symbol_upper] = (symbol_re, other_coin_re)
+    return symbol_re, other_coin_re
+
 NEWS_ENDPOINT = os.getenv('NEWS_API_URL', 'https://min-api.cryptocompare.com/data/v2/news/?categories=MARKET')
 
+# Shared HTTP client with a keep-alive pool: repeat requests reuse sockets
+# (and multiplex over HTTP/2 where the server supports it) instead of paying
+# a fresh TCP+TLS handshake per call like module-level httpx.get() does.
+# The transport retries dropped connections twice before the error reaches
+# the per-endpoint failover loops
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    ),
+    timeout=httpx.Timeout(5.0, connect=2.0),
+    headers={'Accept-Encoding': 'gzip'},
+)
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket used to pace outbound API calls.
+
+    Replaces fixed time.sleep() gates: callers block only as long as needed
+    to stay under the configured rate, instead of always waiting a fixed delay.
+    """
+
+    def __init__(self, rate_per_second: float):
+        self.rate = max(rate_per_second, 0.001)
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+# Last Binance endpoint that answered successfully. It is tried first on the
+# next call, so during a regional outage the serial failover cost is paid
+# once instead of on every fetch (assignment is atomic; no lock needed)
+_binance_best_url: Optional[str] = None
+
+
+def _binance_url_order() -> list:
+    """BINANCE_BASE_URLS with the last-known-good endpoint hoisted to front."""
+    best = _binance_best_url
+    if best is None or best == BINANCE_BASE_URLS[0]:
+        return BINANCE_BASE_URLS
+    return [best] + [url for url in BINANCE_BASE_URLS if url != best]
+
+
+# Per-upstream limiters (rates are requests/second, env-configurable)
+_BINANCE_LIMITER = _TokenBucket(float(os.getenv('BINANCE_RATE_LIMIT_PER_SEC', '20')))
+_COINGECKO_LIMITER = _TokenBucket(float(os.getenv('COINGECKO_RATE_LIMIT_PER_SEC', '0.5')))
+_NEWS_LIMITER = _TokenBucket(float(os.getenv('NEWS_RATE_LIMIT_PER_SEC', '2')))
+
 
 def _fetch_price_binance(symbol: str) -> Optional[Dict[str, Any]]:
     """Fetch price from Binance API (primary source)
@@ -53,15 +248,18 @@ def _fetch_price_binance(symbol: str) -> Optional[Dict[str, Any]]:
         # Auto-detect: try common pattern {SYMBOL}USDT
         binance_symbol = f"{symbol_upper}USDT"
     
-    for base_url in BINANCE_BASE_URLS:
+    global _binance_best_url
+    for base_url in _binance_url_order():
         try:
-            resp = httpx.get(
+            _BINANCE_LIMITER.acquire()
+            resp = _CLIENT.get(
                 f'{base_url}/api/v3/ticker/24hr',
                 params={'symbol': binance_symbol},
                 timeout=5.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                _binance_best_url = base_url
+                data = _json_loads(resp.content)
                 price = float(data.get('lastPrice', 0))
                 price_change_pct = float(data.get('priceChangePercent', 0))
                 return {
@@ -78,7 +276,117 @@ def _fetch_price_binance(symbol: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+# Prices pre-warmed by fetch_prices batches: SYMBOL -> (payload, fetched_at)
+_bulk_price_cache: Dict[str, tuple] = {}
+_bulk_price_lock = threading.Lock()
+
+
+def _fetch_prices_binance(symbols) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch 24hr tickers for many symbols in one Binance round-trip.
+
+    /api/v3/ticker/24hr accepts a JSON-array symbols parameter, so one call
+    replaces N. Note Binance rejects the whole batch with a 400 if any pair
+    is unknown, so callers must fall back for symbols missing from the result.
+    """
+    global _binance_best_url
+    pair_to_symbol = {}
+    for symbol in symbols:
+        symbol_upper = symbol.upper()
+        pair_to_symbol[BINANCE_SYMBOLS.get(symbol_upper, f"{symbol_upper}USDT")] = symbol_upper
+
+    if not pair_to_symbol:
+        return {}
+
+    symbols_param = '["' + '","'.join(pair_to_symbol) + '"]'
+    for base_url in _binance_url_order():
+        try:
+            _BINANCE_LIMITER.acquire()
+            resp = _CLIENT.get(
+                f'{base_url}/api/v3/ticker/24hr',
+                params={'symbols': symbols_param},
+                timeout=5.0,
+            )
+            if resp.status_code != 200:
+                continue
+            _binance_best_url = base_url
+            results: Dict[str, Dict[str, Any]] = {}
+            for entry in _json_loads(resp.content):
+                symbol_upper = pair_to_symbol.get(entry.get('symbol'))
+                if symbol_upper is None:
+                    continue
+                results[symbol_upper] = {
+                    'spot': float(entry.get('lastPrice', 0)),
+                    'usd_24h_change': float(entry.get('priceChangePercent', 0)),
+                    'source': 'binance',
+                }
+            return results
+        except Exception:
+            continue  # Try next endpoint
+    return {}
+
+
+def fetch_prices(symbols) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch spot prices for many symbols in as few round-trips as possible.
+
+    Tries one bulk Binance ticker call first, then a single batched
+    CoinGecko /simple/price call (comma-separated ids) for whatever is
+    missing. Results are returned as {SYMBOL: price_payload} and also
+    pre-warm the cache consulted by _fetch_price, so per-symbol callers
+    hit memory afterwards.
+    """
+    symbols_upper = [symbol.upper() for symbol in symbols]
+    if not symbols_upper:
+        return {}
+
+    results = _fetch_prices_binance(symbols_upper)
+
+    missing = [symbol for symbol in symbols_upper if symbol not in results]
+    if missing:
+        cg_id_to_symbol = {}
+        for symbol_upper in missing:
+            cg_id_to_symbol[COINGECKO_IDS.get(symbol_upper, symbol_upper.lower())] = symbol_upper
+        try:
+            _COINGECKO_LIMITER.acquire()
+            resp = _CLIENT.get(
+                'https://api.coingecko.com/api/v3/simple/price',
+                params={
+                    'ids': ','.join(cg_id_to_symbol),
+                    'vs_currencies': 'usd',
+                    'include_24hr_change': 'true',
+                },
+                timeout=10.0,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            for cg_id, symbol_upper in cg_id_to_symbol.items():
+                payload = data.get(cg_id)
+                if not payload:
+                    continue
+                results[symbol_upper] = {
+                    'spot': payload.get('usd'),
+                    'usd_24h_change': payload.get('usd_24h_change'),
+                    'source': 'coingecko',
+                }
+        except Exception:
+            pass  # Whatever Binance returned is still usable
+
+    now = time.time()
+    with _bulk_price_lock:
+        for symbol_upper, entry in results.items():
+            _bulk_price_cache[symbol_upper] = (entry, now)
+    return results
+
+
+@_ttl_cached(PRICE_CACHE_TTL)
 def _fetch_price(symbol: str, retries: int = 3) -> Dict[str, Any]:
+    # Served from a recent fetch_prices batch when available
+    with _bulk_price_lock:
+        hit = _bulk_price_cache.get(symbol.upper())
+        if hit is not None and time.time() - hit[1] < PRICE_CACHE_TTL:
+            return hit[0]
+
     # Try Binance first (better rate limits)
     binance_result = _fetch_price_binance(symbol)
     if binance_result:
@@ -94,7 +402,8 @@ def _fetch_price(symbol: str, retries: int = 3) -> Dict[str, Any]:
     
     for attempt in range(retries):
         try:
-            resp = httpx.get(
+            _COINGECKO_LIMITER.acquire()
+            resp = _CLIENT.get(
                 'https://api.coingecko.com/api/v3/simple/price',
                 params={'ids': cg_id, 'vs_currencies': 'usd', 'include_24hr_change': 'true'},
                 timeout=10.0,
@@ -109,7 +418,7 @@ def _fetch_price(symbol: str, retries: int = 3) -> Dict[str, Any]:
                 return {'error': 'Rate limit exceeded after retries'}
             
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             payload = data.get(cg_id, {})
             return {
                 'spot': payload.get('usd'),
@@ -128,10 +437,11 @@ def _fetch_price(symbol: str, retries: int = 3) -> Dict[str, Any]:
     return {'error': 'Failed after retries'}
 
 
-def _fetch_ohlc_binance(symbol: str, days: int = 7) -> Optional[list]:
+def _fetch_ohlc_binance(symbol: str, days: int = 7) -> Optional[np.ndarray]:
     """Fetch OHLC data from Binance API (primary source)
-    
+
     Automatically tries {SYMBOL}USDT pattern if not in mapping.
+    Returns an (N, 6) float array of [timestamp, open, high, low, close, volume].
     """
     symbol_upper = symbol.upper()
     
@@ -146,9 +456,11 @@ def _fetch_ohlc_binance(symbol: str, days: int = 7) -> Optional[list]:
     interval = '1h'
     limit = min(500, days * 24)  # Binance max is 1000, but we'll use 500 for safety
     
-    for base_url in BINANCE_BASE_URLS:
+    global _binance_best_url
+    for base_url in _binance_url_order():
         try:
-            resp = httpx.get(
+            _BINANCE_LIMITER.acquire()
+            resp = _CLIENT.get(
                 f'{base_url}/api/v3/klines',
                 params={
                     'symbol': binance_symbol,
@@ -158,104 +470,27 @@ def _fetch_ohlc_binance(symbol: str, days: int = 7) -> Optional[list]:
                 timeout=5.0,
             )
             if resp.status_code == 200:
-                klines = resp.json()
-                # Convert Binance format [open_time, open, high, low, close, volume, ...] to our format
-                ohlc_data = []
-                for kline in klines:
-                    ohlc_data.append([
-                        int(kline[0]),  # timestamp
-                        float(kline[1]),  # open
-                        float(kline[2]),  # high
-                        float(kline[3]),  # low
-                        float(kline[4]),  # close
-                        float(kline[5]),  # volume
-                    ])
-                return ohlc_data
+                _binance_best_url = base_url
+                klines = _json_loads(resp.content)
+                if not klines:
+                    return None
+                # Parse Binance format [open_time, open, high, low, close, volume, ...]
+                # straight into a float array; only the first six columns matter
+                return np.asarray(klines, dtype=np.float64)[:, :6]
         except Exception:
             continue  # Try next endpoint
     
     return None
 
 
+@_ttl_cached(OHLC_CACHE_TTL)
 def _fetch_ohlc_data(symbol: str, days: int = 7, retries: int = 3) -> Dict[str, Any]:
     """Fetch OHLC (Open, High, Low, Close) data and calculate technical indicators"""
     # Try Binance first
     binance_ohlc = _fetch_ohlc_binance(symbol, days)
-    if binance_ohlc and len(binance_ohlc) >= 2:
-        # Process Binance data
-        closes = [candle[4] for candle in binance_ohlc]  # Close prices
-        highs = [candle[2] for candle in binance_ohlc]    # High prices
-        lows = [candle[3] for candle in binance_ohlc]     # Low prices
-        
-        current_price = closes[-1]
-        prev_price = closes[-2] if len(closes) > 1 else current_price
-        
-        # Moving Averages
-        ma_7 = sum(closes[-7:]) / min(7, len(closes))
-        ma_20 = sum(closes[-20:]) / min(20, len(closes)) if len(closes) >= 20 else None
-        
-        # Price change
-        price_change_24h = ((current_price - prev_price) / prev_price * 100) if prev_price > 0 else 0
-        
-        # RSI calculation (14-period)
-        rsi_period = 14
-        rsi = None
-        if len(closes) >= rsi_period + 1:
-            gains = []
-            losses = []
-            for i in range(1, min(rsi_period + 1, len(closes))):
-                change = closes[-i] - closes[-i-1]
-                if change > 0:
-                    gains.append(change)
-                    losses.append(0)
-                else:
-                    gains.append(0)
-                    losses.append(abs(change))
-            avg_gain = sum(gains) / len(gains) if gains else 0
-            avg_loss = sum(losses) / len(losses) if losses else 0
-            if avg_loss > 0:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-        
-        # Support and Resistance
-        recent_high = max(highs[-20:]) if len(highs) >= 20 else max(highs)
-        recent_low = min(lows[-20:]) if len(lows) >= 20 else min(lows)
-        
-        # MACD-like signal
-        macd_signal = ma_7 - ma_20 if ma_20 else None
-        
-        # Trend determination
-        if ma_20:
-            if current_price > ma_7 > ma_20:
-                trend = 'bullish'
-            elif current_price < ma_7 < ma_20:
-                trend = 'bearish'
-            else:
-                trend = 'neutral'
-        else:
-            trend = 'bullish' if current_price > ma_7 else 'bearish' if current_price < ma_7 else 'neutral'
-        
-        return {
-            'current_price': round(current_price, 2),
-            'price_change_24h_pct': round(price_change_24h, 2),
-            'moving_averages': {
-                'ma_7': round(ma_7, 2),
-                'ma_20': round(ma_20, 2) if ma_20 else None,
-            },
-            'rsi': round(rsi, 2) if rsi is not None else None,
-            'macd_signal': round(macd_signal, 2) if macd_signal is not None else None,
-            'support_level': round(recent_low, 2),
-            'resistance_level': round(recent_high, 2),
-            'price_position': {
-                'distance_from_support_pct': round(((current_price - recent_low) / recent_low * 100), 2) if recent_low > 0 else None,
-                'distance_from_resistance_pct': round(((recent_high - current_price) / current_price * 100), 2) if current_price > 0 else None,
-            },
-            'trend': trend,
-            'price_above_ma7': current_price > ma_7,
-            'price_above_ma20': current_price > ma_20 if ma_20 else None,
-            'source': 'binance',
-        }
-    
+    if binance_ohlc is not None and len(binance_ohlc) >= 2:
+        return compute_indicators(binance_ohlc, source='binance')
+
     # Fallback to CoinGecko
     symbol_upper = symbol.upper()
     cg_id = COINGECKO_IDS.get(symbol_upper)
@@ -266,7 +501,8 @@ def _fetch_ohlc_data(symbol: str, days: int = 7, retries: int = 3) -> Dict[str,
     
     for attempt in range(retries):
         try:
-            resp = httpx.get(
+            _COINGECKO_LIMITER.acquire()
+            resp = _CLIENT.get(
                 f'https://api.coingecko.com/api/v3/coins/{cg_id}/ohlc',
                 params={'vs_currency': 'usd', 'days': days},
                 timeout=10.0,
@@ -281,84 +517,17 @@ def _fetch_ohlc_data(symbol: str, days: int = 7, retries: int = 3) -> Dict[str,
                 return {'error': 'Rate limit exceeded after retries'}
             
             resp.raise_for_status()
-            ohlc_data = resp.json()
+            ohlc_data = _json_loads(resp.content)
             
             if not ohlc_data or len(ohlc_data) < 2:
                 return {}
             
-            # Extract price data
-            closes = [candle[4] for candle in ohlc_data]  # Close prices
-            highs = [candle[2] for candle in ohlc_data]    # High prices
-            lows = [candle[3] for candle in ohlc_data]     # Low prices
-            
-            current_price = closes[-1]
-            prev_price = closes[-2] if len(closes) > 1 else current_price
-            
-            # Moving Averages
-            ma_7 = sum(closes[-7:]) / min(7, len(closes))
-            ma_20 = sum(closes[-20:]) / min(20, len(closes)) if len(closes) >= 20 else None
-            
-            # Price change
-            price_change_24h = ((current_price - prev_price) / prev_price * 100) if prev_price > 0 else 0
-            
-            # RSI calculation (14-period)
-            rsi_period = 14
-            rsi = None
-            if len(closes) >= rsi_period + 1:
-                gains = []
-                losses = []
-                for i in range(1, min(rsi_period + 1, len(closes))):
-                    change = closes[-i] - closes[-i-1]
-                    if change > 0:
-                        gains.append(change)
-                        losses.append(0)
-                    else:
-                        gains.append(0)
-                        losses.append(abs(change))
-                avg_gain = sum(gains) / len(gains) if gains else 0
-                avg_loss = sum(losses) / len(losses) if losses else 0
-                if avg_loss > 0:
-                    rs = avg_gain / avg_loss
-                    rsi = 100 - (100 / (1 + rs))
-            
-            # Support and Resistance
-            recent_high = max(highs[-20:]) if len(highs) >= 20 else max(highs)
-            recent_low = min(lows[-20:]) if len(lows) >= 20 else min(lows)
-            
-            # MACD-like signal (difference between short and long MA)
-            macd_signal = ma_7 - ma_20 if ma_20 else None
-            
-            # Trend determination
-            if ma_20:
-                if current_price > ma_7 > ma_20:
-                    trend = 'bullish'
-                elif current_price < ma_7 < ma_20:
-                    trend = 'bearish'
-                else:
-                    trend = 'neutral'
-            else:
-                trend = 'bullish' if current_price > ma_7 else 'bearish' if current_price < ma_7 else 'neutral'
-            
-            return {
-                'current_price': round(current_price, 2),
-                'price_change_24h_pct': round(price_change_24h, 2),
-                'moving_averages': {
-                    'ma_7': round(ma_7, 2),
-                    'ma_20': round(ma_20, 2) if ma_20 else None,
-                },
-                'rsi': round(rsi, 2) if rsi is not None else None,
-                'macd_signal': round(macd_signal, 2) if macd_signal is not None else None,
-                'support_level': round(recent_low, 2),
-                'resistance_level': round(recent_high, 2),
-                'price_position': {
-                    'distance_from_support_pct': round(((current_price - recent_low) / recent_low * 100), 2) if recent_low > 0 else None,
-                    'distance_from_resistance_pct': round(((recent_high - current_price) / current_price * 100), 2) if current_price > 0 else None,
-                },
-            'trend': trend,
-            'price_above_ma7': current_price > ma_7,
-            'price_above_ma20': current_price > ma_20 if ma_20 else None,
-            'source': 'coingecko',
-        }
+            # CoinGecko candles are [ts, open, high, low, close] - the same
+            # high/low/close column layout compute_indicators uses, so both
+            # the Binance and CoinGecko branches share one indicator pipeline
+            return compute_indicators(
+                np.asarray(ohlc_data, dtype=np.float64), source='coingecko'
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429 and attempt < retries - 1:
                 wait_time = (2 ** attempt) * 2
@@ -375,6 +544,7 @@ def _fetch_ohlc_data(symbol: str, days: int = 7, retries: int = 3) -> Dict[str,
     return {'error': 'Failed after retries'}
 
 
+@_ttl_cached(NEWS_CACHE_TTL)
 def _fetch_macro_headlines(symbol: str, limit: int = 5) -> Dict[str, Any]:
     """
     Fetch news headlines related to the specific symbol.
@@ -388,89 +558,46 @@ def _fetch_macro_headlines(symbol: str, limit: int = 5) -> Dict[str, Any]:
     To add support for a new symbol:
     1. Add to BINANCE_SYMBOLS if available on Binance
     2. Add to COINGECKO_IDS with CoinGecko coin ID
-    3. Add to symbol_names mapping in this function for better news filtering
+    3. Add to the module-level SYMBOL_NEWS_NAMES mapping for better news filtering
     """
     try:
-        resp = httpx.get(NEWS_ENDPOINT, timeout=10.0)
+        _NEWS_LIMITER.acquire()
+        resp = _CLIENT.get(NEWS_ENDPOINT, timeout=10.0)
         resp.raise_for_status()
-        all_items = resp.json().get('Data', [])
+        all_items = _json_loads(resp.content).get('Data', [])
         
-        # Symbol name variations for filtering
         symbol_upper = symbol.upper()
-        symbol_lower = symbol.lower()
-        symbol_variations = [symbol_upper, symbol_lower, symbol_upper + 'USD', symbol_upper + '/USD']
-        
-        # Map symbol to common names in news
-        symbol_names = {
-            'BTC': ['bitcoin', 'BTC', 'Bitcoin'],
-            'ETH': ['ethereum', 'ETH', 'Ethereum'],
-            'SOL': ['solana', 'SOL', 'Solana'],
-            'AVAX': ['avalanche', 'AVAX', 'Avalanche'],
-            'ARB': ['arbitrum', 'ARB', 'Arbitrum'],
-            'DOGE': ['dogecoin', 'DOGE', 'Dogecoin', 'doge'],
-            'MATIC': ['polygon', 'MATIC', 'Polygon', 'matic'],
-            'LINK': ['chainlink', 'LINK', 'Chainlink'],
-            'ADA': ['cardano', 'ADA', 'Cardano'],
-            'DOT': ['polkadot', 'DOT', 'Polkadot'],
-            'UNI': ['uniswap', 'UNI', 'Uniswap'],
-            'ATOM': ['cosmos', 'ATOM', 'Cosmos'],
-            'XRP': ['ripple', 'XRP', 'Ripple', 'xrp'],
-            'BNB': ['binance', 'BNB', 'Binance Coin', 'binance coin'],
-            'LTC': ['litecoin', 'LTC', 'Litecoin'],
-            'BCH': ['bitcoin cash', 'BCH', 'Bitcoin Cash'],
-        }
-        
-        # Get additional search terms for the symbol
-        if symbol_upper in symbol_names:
-            search_terms = symbol_names[symbol_upper].copy()
-        else:
-            # For new symbols, try to infer coin name from symbol
-            # Common patterns: symbol is often the coin name or abbreviation
-            search_terms = [symbol_upper, symbol_lower]
-            # Try to find coin name from CoinGecko ID if available
-            cg_id = COINGECKO_IDS.get(symbol_upper)
-            if cg_id:
-                # Convert CoinGecko ID to readable name (e.g., 'avalanche-2' -> 'avalanche')
-                coin_name = cg_id.replace('-2', '').replace('-', ' ')
-                search_terms.extend([coin_name, coin_name.title(), coin_name.upper()])
-        
-        search_terms.extend(symbol_variations)
-        
-        # Filter news items that mention the symbol
-        filtered_items = []
+        symbol_re, other_coin_re = _news_patterns(symbol_upper, symbol.lower())
+
+        # Single pass over the feed: bucket each item as symbol-specific or
+        # general-market fallback, so per-item text is only built once
+        symbol_bucket = []
+        general_bucket = []
+        seen_urls = set()
         for item in all_items:
-            title = item.get('title', '').lower()
-            body = item.get('body', '').lower()
-            tags = ' '.join(item.get('tags', [])).lower()
-            categories = ' '.join(item.get('categories', [])).lower()
-            
+            url = item.get('url')
+            if url in seen_urls:
+                continue
+            title_body = f"{item.get('title', '')} {item.get('body', '')}"
+            tags = ' '.join(item.get('tags', []))
+            categories = ' '.join(item.get('categories', []))
+
             # Check if any search term appears in title, body, tags, or categories
-            text_to_search = f"{title} {body} {tags} {categories}"
-            if any(term.lower() in text_to_search for term in search_terms):
-                filtered_items.append(item)
-        
-        # If we don't have enough symbol-specific news, add general market news
-        if len(filtered_items) < limit:
-            # Track URLs we've already added
-            added_urls = {item.get('url') for item in filtered_items}
-            
-            # Add general market news that doesn't mention other specific coins
-            general_terms = ['BTC', 'ETH', 'SOL', 'AVAX', 'ARB', 'DOGE', 'bitcoin', 'ethereum', 'solana', 'avalanche', 'arbitrum', 'dogecoin']
-            for item in all_items:
-                if len(filtered_items) >= limit:
+            if symbol_re.search(f"{title_body} {tags} {categories}"):
+                symbol_bucket.append(item)
+                seen_urls.add(url)
+                # Enough symbol-specific items: stop scanning the rest of
+                # the feed, nothing later can displace these
+                if len(symbol_bucket) >= limit:
                     break
-                if item.get('url') in added_urls:
-                    continue
-                title = item.get('title', '').lower()
-                body = item.get('body', '').lower()
-                text_to_search = f"{title} {body}"
-                # Only add if it doesn't mention other specific coins (to avoid confusion)
-                if not any(term.lower() in text_to_search for term in general_terms if term.upper() != symbol_upper):
-                    filtered_items.append(item)
-                    added_urls.add(item.get('url'))
+            # Fallback candidates must not mention other specific coins
+            # (to avoid confusion)
+            elif len(general_bucket) < limit and not other_coin_re.search(title_body):
+                general_bucket.append(item)
+                seen_urls.add(url)
         
-        # Take up to limit items
-        items = filtered_items[:limit]
+        # Symbol-specific news first, topped up with general market news
+        items = (symbol_bucket + general_bucket)[:limit]
         
         return {
             'headlines': [
@@ -484,8 +611,21 @@ def _fetch_macro_headlines(symbol: str, limit: int = 5) -> Dict[str, Any]:
             ]
         }
     except Exception as e:
-        # Fallback: return empty headlines on error
-        return {'headlines': []}
+        # Fallback: empty headlines, with the 'error' key so _ttl_cached
+        # skips this payload and the next call retries the feed
+        return {'headlines': [], 'error': str(e)}
+
+
+def clear_context_cache():
+    """
+    Clear the market context cache. Useful for testing or to force fresh data.
+    """
+    with _context_cache_lock:
+        _context_cache.clear()
+    with _bulk_price_lock:
+        _bulk_price_cache.clear()
+    for cache in _fetch_caches:
+        cache.clear()
 
 
 def build_market_context(symbol: str) -> str:
@@ -493,15 +633,54 @@ def build_market_context(symbol: str) -> str:
     Returns a JSON string containing all the data needed by the contract.
     Includes both fundamental (news, sentiment) and technical (indicators) data.
     Backend callers should hand this payload to request_update.
+
+    Results are cached per symbol for CONTEXT_CACHE_TTL seconds (configurable
+    via CONTEXT_CACHE_TTL_SECONDS) to avoid redundant API calls when the same
+    symbol is rebuilt across timeframes or closely-spaced scheduler runs.
     """
-    timestamp = datetime.now(tz=timezone.utc).isoformat()
-    price = _fetch_price(symbol)
-    technical = _fetch_ohlc_data(symbol, days=7)
-    news = _fetch_macro_headlines(symbol, limit=5)
+    return _build_market_context(symbol)[1]
+
+
+def build_market_context_dict(symbol: str) -> Dict[str, Any]:
+    """
+    Dict twin of build_market_context, sharing the same cache entry.
+
+    Callers that need to inspect the context (error checks, field reads)
+    can use this to skip a round-trip through JSON. Treat the returned
+    dict as read-only: it is the cached object, not a copy.
+    """
+    return _build_market_context(symbol)[0]
+
+
+def _build_market_context(symbol: str) -> tuple:
+    """Build (or serve from cache) a symbol's context as (dict, json_str)."""
+    symbol_key = symbol.upper()
+
+    with _context_cache_lock:
+        cached = _context_cache.get(symbol_key)
+        if cached is not None:
+            cached_context, cached_json, cached_at = cached
+            if time.time() - cached_at < CONTEXT_CACHE_TTL:
+                return cached_context, cached_json
+
+    now = datetime.now(tz=timezone.utc)
+
+    # Price, OHLC, and news fetches are independent, so run them concurrently:
+    # latency becomes max-of-fetches instead of sum-of-fetches
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        price_future = executor.submit(_fetch_price, symbol)
+        technical_future = executor.submit(_fetch_ohlc_data, symbol, 7)
+        news_future = executor.submit(_fetch_macro_headlines, symbol, 5)
+        price = price_future.result()
+        technical = technical_future.result()
+        news = news_future.result()
 
     context: Dict[str, Any] = {
         'symbol': symbol.upper(),
-        'generated_at': timestamp,
+        'generated_at': now.isoformat(),
+        # Epoch twin of generated_at: consumers can compare integers instead
+        # of parsing ISO-8601 strings
+        'generated_at_unix': int(now.timestamp()),
         'price': price,
         'technical_indicators': technical,
         'macro': news,
@@ -516,5 +695,37 @@ def build_market_context(symbol: str) -> str:
         'notes': 'Context includes technical indicators (RSI, MACD, MA, Support/Resistance) and fundamental data (news, trends)',
     }
 
-    return json.dumps(context, separators=(',', ':'))
+    context_json = _json_dumps(context)
+
+    with _context_cache_lock:
+        _context_cache[symbol_key] = (context, context_json, time.time())
+
+    return context, context_json
+
+
+
+async def build_market_context_async(symbol: str) -> str:
+    """
+    Async wrapper around build_market_context.
+
+    Runs the (thread-safe, internally parallel) sync builder on a worker
+    thread so multiple symbols can be gathered concurrently:
+
+        contexts = await asyncio.gather(*(build_market_context_async(s) for s in symbols))
+
+    The TTL cache and per-upstream rate limiters are shared with the sync path.
+    """
+    return await asyncio.to_thread(build_market_context, symbol)
 
+
+async def build_market_contexts_async(symbols) -> Dict[str, str]:
+    """
+    Build contexts for many symbols concurrently.
+
+    Gathers build_market_context_async over the given symbols and returns
+    {SYMBOL: context_json}. Per-symbol failures surface as exceptions from
+    the gather, mirroring the sync path's behavior of raising on error.
+    """
+    upper = [s.upper() for s in symbols]
+    contexts = await asyncio.gather(*(build_market_context_async(s) for s in upper))
+    return dict(zip(upper, contexts))
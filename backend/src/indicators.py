@@ -0,0 +1,111 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Optional acceleration: JIT the numeric kernels when numba is installed,
+# otherwise fall back to plain NumPy (no hard dependency)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _rsi_core(diffs: np.ndarray) -> float:
+    """Mean-gain/mean-loss RSI over a window of price diffs (-1.0 if flat)."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for diff in diffs:
+        if diff > 0:
+            avg_gain += diff
+        else:
+            avg_loss -= diff
+    avg_gain /= diffs.size
+    avg_loss /= diffs.size
+    if avg_loss <= 0:
+        return -1.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def _rsi(closes: np.ndarray, period: int = 14) -> Optional[float]:
+    """14-period RSI over the trailing window (None if not enough data)."""
+    if closes.size < period + 1:
+        return None
+    diffs = np.diff(closes[-(period + 1):])
+    rsi = _rsi_core(diffs)
+    # float() matters: the fallback kernel returns np.float64, which orjson
+    # refuses to serialize
+    return float(rsi) if rsi >= 0 else None
+
+
+def compute_indicators(ohlc: np.ndarray, source: str) -> Dict[str, Any]:
+    """
+    Compute the technical_indicators payload from an OHLC candle array.
+
+    Expects an (N, >=5) float array with columns
+    [timestamp, open, high, low, close, ...]; the optional sixth column
+    (volume) is ignored. Operating on a NumPy array keeps the math
+    vectorized instead of looping over nested Python lists.
+    """
+    closes = ohlc[:, 4]
+    highs = ohlc[:, 2]
+    lows = ohlc[:, 3]
+
+    current_price = float(closes[-1])
+    prev_price = float(closes[-2]) if closes.size > 1 else current_price
+
+    # Moving Averages
+    ma_7 = float(closes[-7:].mean())
+    ma_20 = float(closes[-20:].mean()) if closes.size >= 20 else None
+
+    # Price change
+    price_change_24h = ((current_price - prev_price) / prev_price * 100) if prev_price > 0 else 0
+
+    # RSI (14-period)
+    rsi = _rsi(closes)
+
+    # Support and Resistance
+    recent_high = float(highs[-20:].max())
+    recent_low = float(lows[-20:].min())
+
+    # MACD-like signal (difference between short and long MA)
+    macd_signal = ma_7 - ma_20 if ma_20 else None
+
+    # Trend determination
+    if ma_20:
+        if current_price > ma_7 > ma_20:
+            trend = 'bullish'
+        elif current_price < ma_7 < ma_20:
+            trend = 'bearish'
+        else:
+            trend = 'neutral'
+    else:
+        trend = 'bullish' if current_price > ma_7 else 'bearish' if current_price < ma_7 else 'neutral'
+
+    return {
+        'current_price': round(current_price, 2),
+        'price_change_24h_pct': round(price_change_24h, 2),
+        'moving_averages': {
+            'ma_7': round(ma_7, 2),
+            'ma_20': round(ma_20, 2) if ma_20 else None,
+        },
+        'rsi': round(rsi, 2) if rsi is not None else None,
+        'macd_signal': round(macd_signal, 2) if macd_signal is not None else None,
+        'support_level': round(recent_low, 2),
+        'resistance_level': round(recent_high, 2),
+        'price_position': {
+            'distance_from_support_pct': round(((current_price - recent_low) / recent_low * 100), 2) if recent_low > 0 else None,
+            'distance_from_resistance_pct': round(((recent_high - current_price) / current_price * 100), 2) if current_price > 0 else None,
+        },
+        'trend': trend,
+        'price_above_ma7': current_price > ma_7,
+        'price_above_ma20': current_price > ma_20 if ma_20 else None,
+        'source': source,
+    }
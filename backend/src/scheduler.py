@@ -1,36 +1,112 @@
+import asyncio
+import functools
 import json
 import logging
 import os
+import re
+import signal
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import List
 
 import schedule
 from dotenv import load_dotenv
 
-from .context_builder import build_market_context
+from .context_builder import _json_dumps, _json_loads, build_market_context, build_market_context_dict
+from .timeframes import TIMEFRAMES, TIMEFRAME_DURATIONS
 from .tx_sender import (
+  SUBMITTERS,
   get_cached_client,
   list_registered_symbols,
-  submit_prediction_update,
-  check_contract_health,
 )
 
-logging.basicConfig(
-  level=logging.INFO,
-  format='[%(asctime)s] %(levelname)s %(message)s',
-)
+log = logging.getLogger(__name__)
 
 # Run lock to prevent overlapping executions
 run_lock = threading.Lock()
 
+# Set to request a clean scheduler shutdown: the main loop waits on this
+# event instead of sleeping, so it can be interrupted immediately
+stop_event = threading.Event()
+
+# Pulls the epoch timestamp straight out of raw context JSON so the expiry
+# check doesn't materialize the whole context dict for one field
+_GEN_AT_UNIX_RE = re.compile(r'"generated_at_unix"\s*:\s*(\d+)')
+
+# Matches the node's "missing prediction" errors without lowercasing the
+# whole exception string (JSON-RPC payloads can be long)
+_NO_PRED_RE = re.compile(r'no predictions recorded|prediction missing', re.IGNORECASE)
+
+# Persistent submission pool shared by every symbol and every run: contract
+# writes funnel through one bounded set of workers (paced globally by the
+# token bucket in tx_sender) instead of short-lived per-symbol executors
+SUBMIT_MAX_WORKERS = int(os.getenv('SUBMIT_MAX_WORKERS', '6'))
+_submit_pool = ThreadPoolExecutor(max_workers=SUBMIT_MAX_WORKERS, thread_name_prefix='submit')
+
+# Companion persistent pools: one for contract reads (expiry checks) and one
+# for the per-symbol fan-out. Keeping them module-level avoids re-creating
+# worker threads every run / every symbol; the three pools are distinct so a
+# symbol task waiting on reads or submits can never deadlock its own pool.
+READ_MAX_WORKERS = int(os.getenv('READ_MAX_WORKERS', str(len(TIMEFRAMES) * 2)))
+_read_pool = ThreadPoolExecutor(max_workers=READ_MAX_WORKERS, thread_name_prefix='read')
+
+SYMBOL_MAX_WORKERS = int(os.getenv('SYMBOL_MAX_WORKERS', '4'))
+_symbol_pool = ThreadPoolExecutor(max_workers=SYMBOL_MAX_WORKERS, thread_name_prefix='symbol')
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_symbols_cached(raw: str) -> List[str]:
+  return [symbol.strip().upper() for symbol in raw.split(',') if symbol.strip()]
+
+
+def _preview(items, limit: int = 10) -> str:
+  """Readable repr for possibly-long symbol lists: first `limit`, then a count."""
+  if len(items) <= limit:
+    return str(items)
+  return f'{items[:limit]} (+{len(items) - limit} more)'
+
 
 def _parse_symbols() -> List[str]:
-  """Parse symbols from .env file (optional whitelist)"""
-  value = os.getenv('SYMBOLS', '')
-  return [symbol.strip().upper() for symbol in value.split(',') if symbol.strip()]
+  """Parse symbols from .env file (optional whitelist)
+
+  The parse is memoized on the raw env string, so repeated scheduler ticks
+  reuse the result while a changed SYMBOLS value still takes effect.
+  """
+  return _parse_symbols_cached(os.getenv('SYMBOLS', ''))
+
+
+def _read_latest_predictions(client, contract_address: str, symbol: str, timeframes) -> dict:
+  """
+  Fetch the latest prediction for every timeframe of a symbol concurrently.
+
+  The per-timeframe reads are independent RPC round-trips, so issuing them
+  on a pool bounds the check cost at ~1 RTT instead of len(timeframes) RTTs.
+  Returns {timeframe: latest_or_None}; read errors map to None, which the
+  expiry check treats as expired (same as the serial behavior).
+  """
+  results = {}
+  future_to_tf = {
+    _read_pool.submit(
+      client.read_contract,
+      address=contract_address,
+      function_name='get_latest_prediction_by_timeframe',
+      args=[symbol, tf],
+    ): tf
+    for tf in timeframes
+  }
+  for future in as_completed(future_to_tf):
+    tf = future_to_tf[future]
+    try:
+      results[tf] = future.result()
+    except Exception as e:
+      if _NO_PRED_RE.search(str(e)):
+        log.debug('%s %s: No prediction found, will create', symbol, tf)
+      else:
+        log.warning('%s %s: Error checking expiration: %s, will update', symbol, tf, e)
+      results[tf] = None
+  return results
 
 
 def is_timeframe_expired(client, contract_address: str, symbol: str, timeframe: str) -> bool:
@@ -45,23 +121,48 @@ def is_timeframe_expired(client, contract_address: str, symbol: str, timeframe:
       function_name='get_latest_prediction_by_timeframe',
       args=[symbol, timeframe]
     )
-    
-    if not latest:
-      logging.debug(f'{symbol} {timeframe}: No prediction exists, will create')
-      return True  # No prediction exists, need to create one
-    
-    # Extract raw_context and parse generated_at
-    raw_context = latest.get('raw_context', '{}')
-    if not raw_context:
-      logging.debug(f'{symbol} {timeframe}: No raw_context, will update')
-      return True
-    
-    try:
-      context = json.loads(raw_context)
+  except Exception as e:
+    # If prediction doesn't exist or error reading, consider expired
+    if _NO_PRED_RE.search(str(e)):
+      log.debug('%s %s: No prediction found, will create', symbol, timeframe)
+    else:
+      log.warning('%s %s: Error checking expiration: %s, will update', symbol, timeframe, e)
+    return True
+  return _is_prediction_expired(latest, symbol, timeframe)
+
+
+def _is_prediction_expired(latest, symbol: str, timeframe: str, now: datetime = None) -> bool:
+  """
+  Pure expiry check on an already-fetched latest prediction (no RPC).
+  Returns True if expired or no prediction exists.
+
+  `now` lets callers snapshot the clock once per run instead of calling
+  datetime.now per (symbol, timeframe).
+  """
+  if now is None:
+    now = datetime.now(timezone.utc)
+  if not latest:
+    log.debug('%s %s: No prediction exists, will create', symbol, timeframe)
+    return True  # No prediction exists, need to create one
+  
+  # Extract raw_context and parse generated_at
+  raw_context = latest.get('raw_context', '{}')
+  if not raw_context:
+    log.debug('%s %s: No raw_context, will update', symbol, timeframe)
+    return True
+  
+  try:
+    # Fast path: contexts written by this backend carry an epoch twin of
+    # generated_at; grab it from the raw text without a full JSON parse
+    match = _GEN_AT_UNIX_RE.search(raw_context)
+    if match:
+      generated_at = datetime.fromtimestamp(int(match.group(1)), tz=timezone.utc)
+    else:
+      context = _json_loads(raw_context)
       generated_at_str = context.get('generated_at', '')
       
       if not generated_at_str:
-        logging.debug(f'{symbol} {timeframe}: No timestamp in context, will update')
+        log.debug('%s %s: No timestamp in context, will update', symbol, timeframe)
         return True  # No timestamp, consider expired
       
       # Parse ISO timestamp
@@ -72,61 +173,115 @@ def is_timeframe_expired(client, contract_address: str, symbol: str, timeframe:
       generated_at = datetime.fromisoformat(generated_at_str)
       if generated_at.tzinfo is None:
         generated_at = generated_at.replace(tzinfo=timezone.utc)
-      
-      # Calculate expiration time based on timeframe
-      timeframe_durations = {
-        '1h': timedelta(hours=1),
-        '4h': timedelta(hours=4),
-        '12h': timedelta(hours=12),
-        '24h': timedelta(hours=24),
-        '7d': timedelta(days=7),
-        '30d': timedelta(days=30),
-      }
-      
-      duration = timeframe_durations.get(timeframe.lower())
-      if not duration:
-        logging.warning(f'{symbol} {timeframe}: Unknown timeframe, will update')
-        return True  # Unknown timeframe, consider expired
-      
-      expiration_time = generated_at + duration
-      now = datetime.now(timezone.utc)
-      
-      is_expired = now >= expiration_time
-      
-      if is_expired:
-        expired_ago = now - expiration_time
-        logging.info(f'{symbol} {timeframe}: EXPIRED (generated: {generated_at.strftime("%Y-%m-%d %H:%M:%S UTC")}, expired: {expiration_time.strftime("%Y-%m-%d %H:%M:%S UTC")}, expired {expired_ago} ago)')
-      else:
-        remaining = expiration_time - now
-        logging.info(f'{symbol} {timeframe}: Still valid (expires in {remaining})')
-      
-      return is_expired
-      
-    except (json.JSONDecodeError, ValueError, KeyError) as e:
-      logging.warning(f'{symbol} {timeframe}: Failed to parse timestamp: {e}, will update')
-      return True  # On error, consider expired to be safe
-      
-  except Exception as e:
-    # If prediction doesn't exist or error reading, consider expired
-    error_msg = str(e).lower()
-    if 'no predictions recorded' in error_msg or 'prediction missing' in error_msg:
-      logging.debug(f'{symbol} {timeframe}: No prediction found, will create')
+    
+    # Calculate expiration time based on timeframe (module-level table;
+    # TIMEFRAMES entries are already canonical lowercase)
+    duration = TIMEFRAME_DURATIONS.get(timeframe) or TIMEFRAME_DURATIONS.get(timeframe.lower())
+    if not duration:
+      log.warning('%s %s: Unknown timeframe, will update', symbol, timeframe)
+      return True  # Unknown timeframe, consider expired
+    
+    expiration_time = generated_at + duration
+
+    is_expired = now >= expiration_time
+    
+    if is_expired:
+      expired_ago = now - expiration_time
+      log.info('%s %s: EXPIRED (generated: %s, expired: %s, expired %s ago)',
+                   symbol, timeframe, generated_at.isoformat(timespec='seconds'),
+                   expiration_time.isoformat(timespec='seconds'), expired_ago)
     else:
-      logging.warning(f'{symbol} {timeframe}: Error checking expiration: {e}, will update')
-    return True
+      remaining = expiration_time - now
+      log.info('%s %s: Still valid (expires in %s)', symbol, timeframe, remaining)
+    
+    return is_expired
+    
+  except (json.JSONDecodeError, ValueError, KeyError) as e:
+    log.warning('%s %s: Failed to parse timestamp: %s, will update', symbol, timeframe, e)
+    return True  # On error, consider expired to be safe
+
+
+def _process_symbol(client, contract_address: str, symbol: str, timeframes=TIMEFRAMES, now: datetime = None) -> dict:
+  """
+  Build context for one symbol and submit predictions for its expired
+  timeframes. Returns per-symbol counters for the run summary.
+  """
+  counters = {
+    'symbol_ok': False,
+    'timeframes_submitted': 0,
+    'timeframes_failed': 0,
+    'timeframes_skipped': 0,
+  }
+
+  symbol_success = True
+  # Check expiration for each timeframe first: if nothing is expired the
+  # context build (three market-data fetches) is skipped entirely
+  latest_by_timeframe = _read_latest_predictions(client, contract_address, symbol, timeframes)
+  expired_timeframes = []
+  for tf in timeframes:
+    if _is_prediction_expired(latest_by_timeframe.get(tf), symbol, tf, now):
+      expired_timeframes.append(tf)
+    else:
+      counters['timeframes_skipped'] += 1
+
+  if not expired_timeframes:
+    log.info('Symbol %s: All timeframes still valid, skipping', symbol)
+    counters['symbol_ok'] = True
+    return counters
+
+  # Build the context as a dict (shared cache with the JSON variant) so the
+  # error check below is a field read, not a parse; serialize once here and
+  # let submissions skip their own parse/re-dump
+  context_dict = build_market_context_dict(symbol)
+  context = _json_dumps(context_dict)
+  price_error = context_dict.get('price', {}).get('error')
+  tech_error = context_dict.get('technical_indicators', {}).get('error')
+  if price_error or tech_error:
+    log.warning('Symbol %s has API errors - price: %s, technical: %s', symbol, price_error, tech_error)
+    log.warning('Submitting anyway, but prediction quality may be reduced')
+
+  log.info('Symbol %s: Submitting %d expired timeframes: %s', symbol, len(expired_timeframes), expired_timeframes)
+
+  # Generate predictions for EXPIRED timeframes only, on the shared pool,
+  # via the pre-bound per-timeframe submitters
+  future_to_timeframe = {
+    _submit_pool.submit(SUBMITTERS[tf], client, contract_address, symbol, context): tf
+    for tf in expired_timeframes
+  }
+
+  # Process results as they complete
+  for future in as_completed(future_to_timeframe):
+    timeframe = future_to_timeframe[future]
+    try:
+      tx_hash, _ = future.result()
+      log.info('Update submitted for %s %s (tx %s)', symbol, timeframe, tx_hash)
+      counters['timeframes_submitted'] += 1
+    except Exception as error:
+      # No traceback capture here: submission failures are common on noisy
+      # reruns and the message carries the actionable detail
+      log.warning('Failed to submit %s prediction for %s: %s', timeframe, symbol, error)
+      counters['timeframes_failed'] += 1
+      symbol_success = False
+
+  counters['symbol_ok'] = symbol_success
+  return counters
 
 
 def run_once():
   # Check if previous run is still in progress
   if not run_lock.acquire(blocking=False):
-    logging.warning('Previous run still in progress, skipping this run to prevent overlap')
+    log.warning('Previous run still in progress, skipping this run to prevent overlap')
     return
   
   try:
-    start_time = time.time()
-    logging.info('=' * 60)
-    logging.info('Starting scheduler run')
-    logging.info('=' * 60)
+    # perf_counter is monotonic, so the elapsed figure logged below is
+    # immune to wall-clock jumps
+    start_time = time.perf_counter()
+    # One clock snapshot shared by every expiry check in this run
+    now = datetime.now(timezone.utc)
+    log.info('=' * 60)
+    log.info('Starting scheduler run')
+    log.info('=' * 60)
     
     # Initialize summary counters
     summary = {
@@ -141,144 +296,188 @@ def run_once():
     # Use cached client for better performance
     client, contract_address, account = get_cached_client()
     
-    # Health check before proceeding
-    if not check_contract_health(client, contract_address):
-      logging.error('Contract health check failed. Skipping this run.')
-      return
-    
-    # Read all symbols from contract
+    # Read all symbols from contract. This doubles as the health check: a
+    # successful (cached) list_symbols read proves the contract is
+    # reachable, so no separate health RPC is spent per run
     try:
       contract_symbols = list_registered_symbols(client, contract_address)
-      logging.info('Found %d symbols in contract: %s', len(contract_symbols), contract_symbols)
+      log.info('Found %d symbols in contract: %s', len(contract_symbols), _preview(contract_symbols))
     except Exception as error:
-      logging.error('Unable to fetch symbols from contract: %s', error, exc_info=True)
+      log.error('Unable to fetch symbols from contract: %s. Skipping this run.', error, exc_info=True)
       return
     
     if not contract_symbols:
-      logging.warning('No symbols registered in contract. Add symbols via frontend first.')
+      log.warning('No symbols registered in contract. Add symbols via frontend first.')
       return
     
     # If SYMBOLS is set in .env, use it as whitelist (only update those symbols)
     # Otherwise, update all symbols from contract
     env_symbols = _parse_symbols()
     if env_symbols:
-      # Use .env as whitelist - only update symbols that are both in contract and .env
-      symbols_to_update = [s for s in contract_symbols if s in env_symbols]
-      logging.info('SYMBOLS whitelist active: Updating %d/%d symbols from contract (%s)', 
-                   len(symbols_to_update), len(contract_symbols), symbols_to_update)
+      # Use .env as whitelist - only update symbols that are both in contract
+      # and .env (set membership keeps both scans linear)
+      whitelist = frozenset(env_symbols)
+      symbols_to_update = [s for s in contract_symbols if s in whitelist]
+      log.info('SYMBOLS whitelist active: Updating %d/%d symbols from contract (%s)',
+                   len(symbols_to_update), len(contract_symbols), _preview(symbols_to_update))
       if len(symbols_to_update) < len(contract_symbols):
-        skipped = [s for s in contract_symbols if s not in symbols_to_update]
-        logging.info('Skipping %d symbols not in whitelist: %s', len(skipped), skipped)
+        skipped = [s for s in contract_symbols if s not in whitelist]
+        log.info('Skipping %d symbols not in whitelist: %s', len(skipped), _preview(skipped))
     else:
       # No .env config - update all symbols from contract
       symbols_to_update = contract_symbols
-      logging.info('No SYMBOLS whitelist in .env - Updating ALL %d symbols from contract: %s', 
-                   len(symbols_to_update), symbols_to_update)
+      log.info('No SYMBOLS whitelist in .env - Updating ALL %d symbols from contract: %s',
+                   len(symbols_to_update), _preview(symbols_to_update))
     
     if not symbols_to_update:
-      logging.warning('No symbols to update (contract has symbols but none match .env whitelist)')
+      log.warning('No symbols to update (contract has symbols but none match .env whitelist)')
       return
 
-    # Supported timeframes
-    TIMEFRAMES = ["1h", "4h", "12h", "24h", "7d", "30d"]
     summary['total_timeframes_checked'] = len(symbols_to_update) * len(TIMEFRAMES)
 
-    for symbol in symbols_to_update:
+    # Symbols are independent, so process them concurrently on the shared
+    # persistent pool. API pacing is handled by the token buckets in
+    # context_builder, so no fixed inter-symbol delay is needed.
+    future_to_symbol = {
+      _symbol_pool.submit(_process_symbol, client, contract_address, symbol, TIMEFRAMES, now): symbol
+      for symbol in symbols_to_update
+    }
+    for future in as_completed(future_to_symbol):
+      symbol = future_to_symbol[future]
       try:
-        context = build_market_context(symbol)
-        # Check if context has critical errors
-        try:
-          context_dict = json.loads(context)
-          price_error = context_dict.get('price', {}).get('error')
-          tech_error = context_dict.get('technical_indicators', {}).get('error')
-          if price_error or tech_error:
-            logging.warning('Symbol %s has API errors - price: %s, technical: %s', symbol, price_error, tech_error)
-            logging.warning('Submitting anyway, but prediction quality may be reduced')
-        except:
-          pass  # If context is not valid JSON, let contract handle it
-        
-        symbol_success = True
-        # Check expiration for each timeframe before submitting
-        expired_timeframes = []
-        for tf in TIMEFRAMES:
-          if is_timeframe_expired(client, contract_address, symbol, tf):
-            expired_timeframes.append(tf)
-          else:
-            summary['timeframes_skipped'] += 1
-        
-        if not expired_timeframes:
-          logging.info('Symbol %s: All timeframes still valid, skipping', symbol)
-          summary['symbols_processed'] += 1
-          continue
-        
-        logging.info('Symbol %s: Submitting %d expired timeframes: %s', symbol, len(expired_timeframes), expired_timeframes)
-        
-        # Generate predictions for EXPIRED timeframes only, in parallel (with rate limiting)
-        max_workers = min(3, len(expired_timeframes))  # Limit concurrent submissions to avoid rate limits
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-          # Submit only expired timeframes
-          future_to_timeframe = {
-            executor.submit(submit_prediction_update, client, contract_address, symbol, context, tf): tf
-            for tf in expired_timeframes
-          }
-          
-          # Process results as they complete
-          for future in as_completed(future_to_timeframe):
-            timeframe = future_to_timeframe[future]
-            try:
-              tx_hash, _ = future.result()
-              logging.info('Update submitted for %s %s (tx %s)', symbol, timeframe, tx_hash)
-              summary['timeframes_submitted'] += 1
-            except Exception as error:
-              logging.exception('Failed to submit %s prediction for %s: %s', timeframe, symbol, error)
-              summary['timeframes_failed'] += 1
-              symbol_success = False
-        
-        if symbol_success:
+        counters = future.result()
+        summary['timeframes_submitted'] += counters['timeframes_submitted']
+        summary['timeframes_failed'] += counters['timeframes_failed']
+        summary['timeframes_skipped'] += counters['timeframes_skipped']
+        if counters['symbol_ok']:
           summary['symbols_processed'] += 1
         else:
           summary['symbols_failed'] += 1
-        
-        # Add delay between symbols to avoid rate limits
-        if symbol != symbols_to_update[-1]:
-          time.sleep(3)  # 3 second delay between symbols
       except Exception as error:
-        logging.exception('Failed to process %s: %s', symbol, error)
+        log.exception('Failed to process %s: %s', symbol, error)
         summary['symbols_failed'] += 1
     
     # Log summary
-    elapsed_time = time.time() - start_time
-    logging.info('=' * 60)
-    logging.info('Scheduler run completed in %.2f seconds', elapsed_time)
-    logging.info('Summary:')
-    logging.info('  Symbols processed: %d/%d', summary['symbols_processed'], len(symbols_to_update))
-    logging.info('  Symbols failed: %d', summary['symbols_failed'])
-    logging.info('  Timeframes checked: %d', summary['total_timeframes_checked'])
-    logging.info('  Timeframes submitted: %d (expired)', summary['timeframes_submitted'])
-    logging.info('  Timeframes skipped: %d (still valid)', summary['timeframes_skipped'])
-    logging.info('  Timeframes failed: %d', summary['timeframes_failed'])
+    elapsed_time = time.perf_counter() - start_time
+    log.info('=' * 60)
+    log.info('Scheduler run completed in %.2f seconds', elapsed_time)
+    log.info('Summary:')
+    log.info('  Symbols processed: %d/%d', summary['symbols_processed'], len(symbols_to_update))
+    log.info('  Symbols failed: %d', summary['symbols_failed'])
+    log.info('  Timeframes checked: %d', summary['total_timeframes_checked'])
+    log.info('  Timeframes submitted: %d (expired)', summary['timeframes_submitted'])
+    log.info('  Timeframes skipped: %d (still valid)', summary['timeframes_skipped'])
+    log.info('  Timeframes failed: %d', summary['timeframes_failed'])
     if summary['total_timeframes_checked'] > 0:
       expired_rate = (summary['timeframes_submitted'] / summary['total_timeframes_checked'] * 100)
-      logging.info('  Expired rate: %.1f%%', expired_rate)
-    logging.info('=' * 60)
+      log.info('  Expired rate: %.1f%%', expired_rate)
+    log.info('=' * 60)
     
   finally:
     run_lock.release()
 
 
+async def run_once_async():
+  """
+  Async entry point for embedding the scheduler in an event loop.
+
+  The run itself stays on the shared thread pools (contract reads and
+  writes are sync genlayer-py calls), so this just keeps the caller's
+  loop responsive while a run is in flight — the same bridge
+  context_builder uses for its async surface.
+  """
+  await asyncio.to_thread(run_once)
+
+
+# Speculative pre-warm: how long before each scheduled run the background
+# thread builds contexts so run_once starts from a hot cache. Keep this
+# below CONTEXT_CACHE_TTL_SECONDS or the entries expire before the tick;
+# set to 0 to disable.
+PREWARM_LEAD_SECONDS = int(os.getenv('PREWARM_LEAD_SECONDS', '45'))
+
+
+def _prewarm_contexts():
+  """
+  Build market contexts for symbols that will need an update on the next
+  run, so the tick itself starts with the TTL cache already populated.
+  """
+  try:
+    client, contract_address, _account = get_cached_client()
+    symbols = list_registered_symbols(client, contract_address)
+    env_symbols = _parse_symbols()
+    if env_symbols:
+      whitelist = frozenset(env_symbols)
+      symbols = [s for s in symbols if s in whitelist]
+
+    prewarmed = 0
+    now = datetime.now(timezone.utc)
+    for symbol in symbols:
+      # Mirror run_once's filter: only symbols with an expired timeframe
+      # get a context build, so quiet symbols stay API-free
+      latest_by_tf = _read_latest_predictions(client, contract_address, symbol, TIMEFRAMES)
+      if any(_is_prediction_expired(latest_by_tf.get(tf), symbol, tf, now) for tf in TIMEFRAMES):
+        build_market_context(symbol)
+        prewarmed += 1
+    if prewarmed:
+      log.info('Pre-warmed market contexts for %d symbols', prewarmed)
+  except Exception as error:
+    log.debug('Context pre-warm skipped: %s', error)
+
+
+def _prewarm_loop():
+  """Fire _prewarm_contexts PREWARM_LEAD_SECONDS before each run."""
+  while not stop_event.is_set():
+    idle = schedule.idle_seconds()
+    if idle is None:
+      if stop_event.wait(60):
+        return
+      continue
+    if idle > PREWARM_LEAD_SECONDS:
+      if stop_event.wait(idle - PREWARM_LEAD_SECONDS):
+        return
+      continue
+    _prewarm_contexts()
+    # Step past this tick so the next iteration targets the following run
+    if stop_event.wait(max(idle, 1) + 1):
+      return
+
+
 def main():
   load_dotenv()
+  # Configure logging here rather than at import time, so importing this
+  # module (tests, scripts) doesn't reconfigure the root logger
+  logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s %(message)s',
+  )
   # Default to 1 hour (3600 seconds)
   interval = int(os.getenv('UPDATE_INTERVAL_SECONDS', '3600'))
 
+  # Translate SIGTERM/SIGINT into a stop request: the main loop and the
+  # pre-warm thread both wait on stop_event, so either signal wakes them
+  # immediately while any in-flight run finishes under its own lock
+  def _request_stop(signum, frame):
+    log.info('Received signal %d, shutting down after current work', signum)
+    stop_event.set()
+
+  signal.signal(signal.SIGTERM, _request_stop)
+  signal.signal(signal.SIGINT, _request_stop)
+
   run_once()
   schedule.every(interval).seconds.do(run_once)
 
-  logging.info('Scheduler started (interval=%ss)', interval)
-  while True:
+  if PREWARM_LEAD_SECONDS > 0:
+    threading.Thread(target=_prewarm_loop, name='context-prewarm', daemon=True).start()
+
+  log.info('Scheduler started (interval=%ss, prewarm_lead=%ss)', interval, PREWARM_LEAD_SECONDS)
+  while not stop_event.is_set():
     schedule.run_pending()
-    time.sleep(1)
+    # Wait until the next scheduled job instead of waking every second; an
+    # Event wait is interruptible, unlike time.sleep
+    idle = schedule.idle_seconds()
+    stop_event.wait(max(1, idle if idle is not None else 1))
+
+  log.info('Scheduler stopped')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,18 @@
+from datetime import timedelta
+from typing import Dict, Tuple
+
+# Single source of truth for the prediction timeframes supported by the
+# contract. Frozen as a tuple so it can be shared safely across threads.
+TIMEFRAMES: Tuple[str, ...] = ("1h", "4h", "12h", "24h", "7d", "30d")
+
+# How long a prediction for each timeframe stays valid. Built once here so
+# hot paths (the per-symbol expiration checks) do dict lookups instead of
+# reconstructing timedelta tables per call.
+TIMEFRAME_DURATIONS: Dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "4h": timedelta(hours=4),
+    "12h": timedelta(hours=12),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
@@ -1,26 +1,106 @@
-import json
+import functools
 import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, List, Optional, Tuple
 
+import requests
 from dotenv import load_dotenv
 from genlayer_py import create_account, create_client
 from genlayer_py.chains import studionet
 from genlayer_py.types import TransactionStatus
 
+from .context_builder import _TokenBucket, _json_dumps, _json_loads
+from .timeframes import TIMEFRAMES
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# Client caching for reuse
-_client_cache: Optional[Tuple] = None
-_client_cache_timestamp: Optional[float] = None
+# Frozen set for O(1) timeframe validation, derived from the canonical
+# tuple so the two can never drift apart
+VALID_TIMEFRAMES = frozenset(TIMEFRAMES)
+
+# Paces contract writes across threads: the parallel timeframe/symbol
+# fan-outs self-limit to an actual QPS cap instead of sleeping fixed delays
+_RPC_BUCKET = _TokenBucket(float(os.getenv('RPC_RATE_LIMIT_PER_SEC', '5')))
+
+# Client pooling for reuse, keyed by (rpc_url, contract_address) so the
+# underlying HTTP transport (and its keep-alive connections) is shared by
+# every caller targeting the same endpoint
+_client_pool: dict = {}
+_client_pool_timestamps: dict = {}
 _client_cache_lock = threading.Lock()
 CLIENT_CACHE_TTL = 300  # 5 minutes cache TTL
 
 
+def _client_pool_key() -> Tuple[str, str]:
+    return (os.getenv('GENLAYER_RPC_URL', ''), os.getenv('CONTRACT_ADDRESS', ''))
+
+
+# Optimistic submission: writes return as soon as the transaction is in,
+# while a small background pool confirms receipts and logs the outcome.
+# The bounded semaphore is the backpressure valve — once MAX_INFLIGHT_TX
+# transactions are awaiting confirmation, further writes block until one
+# settles, so a slow chain can't pile up unbounded pending work.
+MAX_INFLIGHT_TX = int(os.getenv('MAX_INFLIGHT_TX', '8'))
+_inflight_txs = threading.BoundedSemaphore(MAX_INFLIGHT_TX)
+_receipt_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv('RECEIPT_MAX_WORKERS', '4')),
+    thread_name_prefix='receipt',
+)
+
+# Optional sender rotation: with PRIVATE_KEY_1..N set, writes round-robin
+# across those accounts so per-account nonce ordering no longer serializes
+# parallel submissions. Built lazily and keyed on the endpoint like the
+# client pool above.
+_sender_clients: list = []
+_sender_clients_key: Optional[Tuple[str, str]] = None
+_sender_index = 0
+_sender_lock = threading.Lock()
+
+# Registered-symbol cache: the symbol set changes rarely, so closely spaced
+# scheduler cycles reuse a recent read instead of paying an RPC round-trip
+_symbol_list_cache: dict = {}
+_symbol_list_lock = threading.Lock()
+SYMBOL_LIST_CACHE_TTL = int(os.getenv('SYMBOL_LIST_CACHE_TTL_SECONDS', '600'))
+
+
+class SymbolAlreadyExistsError(ValueError):
+    """Raised when add_symbol targets a symbol the contract already knows."""
+
+
+def _install_pooled_rpc_session() -> None:
+    """
+    Route genlayer_py's JSON-RPC calls through a shared keep-alive session.
+
+    The library's provider issues every RPC via module-level requests.post,
+    which opens a fresh TCP+TLS connection per call (~2 RTTs of handshake
+    each). A requests.Session with a pooled adapter reuses connections
+    across all reads and writes in the process. The session stands in for
+    the module object the provider references (post + exceptions), so the
+    library's behavior is otherwise unchanged.
+    """
+    from genlayer_py.provider import provider as gl_provider
+
+    if isinstance(getattr(gl_provider, 'requests', None), requests.Session):
+        return  # already installed
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=int(os.getenv('RPC_POOL_MAXSIZE', '20')),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.exceptions = requests.exceptions  # provider references requests.exceptions
+    gl_provider.requests = session
+
+
+_install_pooled_rpc_session()
+
+
 def _resolve_chain():
     rpc_url = os.getenv('GENLAYER_RPC_URL')
     if not rpc_url:
@@ -51,6 +131,47 @@ def initialise_client():
     return client, contract_address, account
 
 
+def _load_extra_private_keys() -> List[str]:
+    """Collect PRIVATE_KEY_1, PRIVATE_KEY_2, ... until the first gap."""
+    keys: List[str] = []
+    index = 1
+    while True:
+        key = os.getenv(f'PRIVATE_KEY_{index}')
+        if not key:
+            break
+        keys.append(key)
+        index += 1
+    return keys
+
+
+def _next_sender_client():
+    """
+    Round-robin over clients built from PRIVATE_KEY_1..N, giving each write
+    an independent nonce lane. Returns None when no extra keys are
+    configured, in which case callers fall back to their own client.
+    """
+    global _sender_clients, _sender_clients_key, _sender_index
+    with _sender_lock:
+        key = _client_pool_key()
+        if _sender_clients_key != key:
+            chain, endpoint = _resolve_chain()
+            clients = []
+            for private_key in _load_extra_private_keys():
+                account = create_account(private_key)
+                if endpoint:
+                    clients.append(create_client(chain=chain, account=account, endpoint=endpoint))
+                else:
+                    clients.append(create_client(chain=chain, account=account))
+            _sender_clients = clients
+            _sender_clients_key = key
+            _sender_index = 0
+        if not _sender_clients:
+            return None
+        client = _sender_clients[_sender_index % len(_sender_clients)]
+        _sender_index += 1
+        return client
+
+
 def get_cached_client():
     """
     Get a cached client instance, creating a new one if cache is expired or missing.
@@ -59,35 +180,39 @@ def get_cached_client():
     Returns:
         Tuple of (client, contract_address, account)
     """
-    global _client_cache, _client_cache_timestamp
-    
+    key = _client_pool_key()
+
     with _client_cache_lock:
         current_time = time.time()
-        
-        # Check if cache is valid
-        if (_client_cache is not None and 
-            _client_cache_timestamp is not None and 
-            current_time - _client_cache_timestamp < CLIENT_CACHE_TTL):
-            logger.debug(f"Using cached client (age: {current_time - _client_cache_timestamp:.1f}s)")
-            return _client_cache
-        
+
+        # Check if pooled client for this endpoint is still valid
+        cached = _client_pool.get(key)
+        cached_at = _client_pool_timestamps.get(key)
+        if cached is not None and cached_at is not None and current_time - cached_at < CLIENT_CACHE_TTL:
+            logger.debug(f"Using cached client (age: {current_time - cached_at:.1f}s)")
+            return cached
+
         # Create new client
         logger.info("Creating new client instance (cache expired or missing)")
-        _client_cache = initialise_client()
-        _client_cache_timestamp = current_time
-        return _client_cache
+        client_tuple = initialise_client()
+        _client_pool[key] = client_tuple
+        _client_pool_timestamps[key] = current_time
+        return client_tuple
 
 
 def clear_client_cache():
     """
     Clear the client cache. Useful for testing or when credentials change.
     """
-    global _client_cache, _client_cache_timestamp
-    
+    global _sender_clients_key
     with _client_cache_lock:
-        _client_cache = None
-        _client_cache_timestamp = None
+        _client_pool.clear()
+        _client_pool_timestamps.clear()
         logger.info("Client cache cleared")
+    with _symbol_list_lock:
+        _symbol_list_cache.clear()
+    with _sender_lock:
+        _sender_clients_key = None
 
 
 def _normalise_symbol_list(raw: Iterable) -> List[str]:
@@ -109,15 +234,27 @@ def _normalise_symbol_list(raw: Iterable) -> List[str]:
     return symbols
 
 
-def list_registered_symbols(client, contract_address: str) -> List[str]:
+def list_registered_symbols(client, contract_address: str, use_cache: bool = True) -> List[str]:
+    """
+    Read the contract's symbol list, serving repeats from a short TTL cache.
+
+    Pass use_cache=False to force a fresh read (e.g. right after add_symbol).
+    """
+    if use_cache:
+        with _symbol_list_lock:
+            cached = _symbol_list_cache.get(contract_address)
+            if cached is not None and time.time() - cached[1] < SYMBOL_LIST_CACHE_TTL:
+                return list(cached[0])
+
     try:
         response = client.read_contract(address=contract_address, function_name='list_symbols', args=[])
     except Exception as exc:
         logger.error('Failed to read list_symbols: %s', exc, exc_info=True)
         raise
-    if response is None:
-        return []
-    return _normalise_symbol_list(response)
+    symbols = [] if response is None else _normalise_symbol_list(response)
+    with _symbol_list_lock:
+        _symbol_list_cache[contract_address] = (symbols, time.time())
+    return symbols
 
 
 def check_contract_health(client, contract_address: str) -> bool:
@@ -141,10 +278,33 @@ def check_contract_health(client, contract_address: str) -> bool:
         return False
 
 
-def submit_prediction_update(client, contract_address: str, symbol: str, context_json: str, timeframe: str = "24h", max_retries: int = 3) -> Tuple[str, str]:
+def _watch_receipt(send_client, tx_hash: str, symbol: str, timeframe: str) -> None:
+    """Confirm a submitted transaction in the background and log the outcome."""
+    try:
+        receipt = send_client.wait_for_transaction_receipt(
+            transaction_hash=tx_hash,
+            status=TransactionStatus.ACCEPTED,
+            retries=20,  # 60 seconds total
+            interval=3000  # 3 seconds between retries
+        )
+        receipt_id = receipt.id if hasattr(receipt, 'id') else ''
+        logger.info(f"Transaction accepted: {tx_hash} ({symbol} {timeframe}), receipt_id={receipt_id}")
+    except Exception as e:
+        logger.warning(f"Transaction not yet accepted: {tx_hash} ({symbol} {timeframe})")
+        logger.warning(f"Transaction may still be processing. Error: {e}")
+    finally:
+        _inflight_txs.release()
+
+
+def submit_prediction_update(client, contract_address: str, symbol: str, context_json: str, timeframe: str = "24h", max_retries: int = 3, wait_for_receipt: bool = False, skip_validation: bool = False) -> Tuple[str, str]:
     """
     Submit a prediction update transaction to the GenLayer contract with retry logic.
-    
+
+    By default the call returns as soon as the transaction is submitted and
+    a background watcher confirms the receipt, so callers aren't gated on
+    block finalization. Pass wait_for_receipt=True for the old blocking
+    behavior (e.g. scripts that need the receipt id).
+
     Args:
         client: GenLayer client instance
         contract_address: Contract address
@@ -152,22 +312,31 @@ def submit_prediction_update(client, contract_address: str, symbol: str, context
         context_json: JSON string containing market context data
         timeframe: Prediction timeframe ("1h", "4h", "12h", "24h", "7d", "30d")
         max_retries: Maximum number of retry attempts (default: 3)
-    
+        wait_for_receipt: Block until the transaction is accepted (default: False)
+        skip_validation: Trust context_json as already-minified valid JSON,
+            skipping the parse/re-dump round-trip (default: False)
+
     Returns:
-        Tuple of (transaction_hash, receipt_id)
+        Tuple of (transaction_hash, receipt_id); receipt_id is '' when the
+        receipt is confirmed in the background
     """
-    import time
-    
-    # Validate and normalize JSON
-    try:
-        # Parse to ensure it's valid JSON
-        parsed = json.loads(context_json)
-        # Re-serialize to ensure consistent formatting (minified)
-        normalized_json = json.dumps(parsed, separators=(',', ':'))
-        logger.debug(f"JSON validated and normalized. Length: {len(normalized_json)} chars")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in context_json: {e}")
-        raise ValueError(f"Invalid JSON in context_json: {e}") from e
+    # Validate and normalize JSON. Callers that serialized the context
+    # themselves (e.g. the scheduler, via build_market_context_dict) pass
+    # skip_validation=True so the blob isn't parsed and re-dumped per
+    # (symbol, timeframe).
+    if skip_validation:
+        normalized_json = context_json
+    else:
+        try:
+            # Parse to ensure it's valid JSON (orjson-backed when available)
+            parsed = _json_loads(context_json)
+            # Re-serialize to ensure consistent formatting (minified)
+            normalized_json = _json_dumps(parsed)
+            logger.debug(f"JSON validated and normalized. Length: {len(normalized_json)} chars")
+        except ValueError as e:
+            # Both orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError
+            logger.error(f"Invalid JSON in context_json: {e}")
+            raise ValueError(f"Invalid JSON in context_json: {e}") from e
     
     # Ensure symbol is uppercase and stripped
     symbol_clean = symbol.upper().strip()
@@ -175,30 +344,46 @@ def submit_prediction_update(client, contract_address: str, symbol: str, context
         raise ValueError("symbol cannot be empty")
     
     # Validate timeframe
-    valid_timeframes = ["1h", "4h", "12h", "24h", "7d", "30d"]
     timeframe_clean = timeframe.lower().strip()
-    if timeframe_clean not in valid_timeframes:
-        raise ValueError(f"invalid timeframe. Must be one of: {valid_timeframes}")
+    if timeframe_clean not in VALID_TIMEFRAMES:
+        raise ValueError(f"invalid timeframe. Must be one of: {sorted(VALID_TIMEFRAMES)}")
     
     logger.info(f"Submitting transaction: symbol={symbol_clean}, timeframe={timeframe_clean}, contract={contract_address}")
     logger.debug(f"Context JSON preview (first 200 chars): {normalized_json[:200]}...")
     
+    # Rotate across configured sender accounts (nonce lanes) so parallel
+    # submissions don't queue behind one account's nonce sequence; with a
+    # single PRIVATE_KEY the caller's client is used as before
+    send_client = _next_sender_client() or client
+
     # Retry logic for transaction submission
     last_exception = None
     for attempt in range(max_retries):
         try:
             # Call contract method
-            tx_hash = client.write_contract(
-                address=contract_address,
-                function_name='request_update',
-                args=[symbol_clean, normalized_json, timeframe_clean],
-            )
+            _RPC_BUCKET.acquire()
+            _inflight_txs.acquire()
+            try:
+                tx_hash = send_client.write_contract(
+                    address=contract_address,
+                    function_name='request_update',
+                    args=[symbol_clean, normalized_json, timeframe_clean],
+                )
+            except Exception:
+                _inflight_txs.release()
+                raise
             logger.info(f"Transaction submitted: {tx_hash} (attempt {attempt + 1}/{max_retries})")
-            
+
+            if not wait_for_receipt:
+                # Optimistic path: hand confirmation to the background
+                # watcher, which releases the in-flight slot when done
+                _receipt_pool.submit(_watch_receipt, send_client, tx_hash, symbol_clean, timeframe_clean)
+                return tx_hash, ''
+
             # Wait for transaction to be accepted (with increased timeout)
             try:
-                receipt = client.wait_for_transaction_receipt(
-                    transaction_hash=tx_hash, 
+                receipt = send_client.wait_for_transaction_receipt(
+                    transaction_hash=tx_hash,
                     status=TransactionStatus.ACCEPTED,
                     retries=20,  # 60 seconds total
                     interval=3000  # 3 seconds between retries
@@ -213,7 +398,9 @@ def submit_prediction_update(client, contract_address: str, symbol: str, context
                 logger.warning(f"Transaction may still be processing. Error: {e}")
                 # Return tx_hash anyway so scheduler can continue
                 return tx_hash, ''
-                
+            finally:
+                _inflight_txs.release()
+
         except Exception as e:
             last_exception = e
             if attempt < max_retries - 1:
@@ -232,6 +419,17 @@ def submit_prediction_update(client, contract_address: str, symbol: str, context
     raise RuntimeError("Transaction submission failed for unknown reason")
 
 
+# Per-timeframe submitters with the timeframe pre-bound at import time.
+# Callers iterating the known timeframes (the scheduler) can index this
+# table instead of re-passing and re-validating the timeframe per call;
+# the contexts they hand over are already normalized, hence
+# skip_validation.
+SUBMITTERS = {
+    tf: functools.partial(submit_prediction_update, timeframe=tf, skip_validation=True)
+    for tf in TIMEFRAMES
+}
+
+
 def add_symbol(client, contract_address: str, symbol: str, description: str) -> Tuple[str, str]:
     """
     Add a new symbol to the contract.
@@ -252,6 +450,7 @@ def add_symbol(client, contract_address: str, symbol: str, description: str) ->
     logger.info(f"Adding symbol: {symbol_clean}, description: {description}")
     
     try:
+        _RPC_BUCKET.acquire()
         tx_hash = client.write_contract(
             address=contract_address,
             function_name='add_symbol',
@@ -259,6 +458,10 @@ def add_symbol(client, contract_address: str, symbol: str, description: str) ->
         )
         logger.info(f"Add symbol transaction submitted: {tx_hash}")
     except Exception as e:
+        if 'symbol already exists' in str(e).lower():
+            # Surface the contract revert as a typed error so callers can
+            # classify it without their own string matching
+            raise SymbolAlreadyExistsError(f"symbol {symbol_clean} already registered") from e
         logger.error(f"Failed to submit add_symbol transaction: {e}", exc_info=True)
         raise
     
@@ -6,21 +6,24 @@ import unittest
 from unittest.mock import patch, MagicMock
 import json
 
-from src.context_builder import build_market_context, _fetch_price, _fetch_ohlc_data, _fetch_macro_headlines
+from src.context_builder import BINANCE_BASE_URLS, build_market_context, clear_context_cache, _fetch_price, _fetch_ohlc_data, _fetch_macro_headlines
 
 
 class TestContextBuilder(unittest.TestCase):
     """Test cases for context builder functions"""
 
-    @patch('src.context_builder.httpx.get')
+    def setUp(self):
+        clear_context_cache()
+
+    @patch('src.context_builder._CLIENT.get')
     def test_fetch_price_binance_success(self, mock_get):
         """Test successful price fetch from Binance"""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'lastPrice': '50000.00',
             'priceChangePercent': '2.5'
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         result = _fetch_price('BTC', retries=1)
@@ -30,24 +33,23 @@ class TestContextBuilder(unittest.TestCase):
         self.assertEqual(result['usd_24h_change'], 2.5)
         self.assertEqual(result['source'], 'binance')
 
-    @patch('src.context_builder.httpx.get')
+    @patch('src.context_builder._CLIENT.get')
     def test_fetch_price_binance_fallback_coingecko(self, mock_get):
         """Test fallback to CoinGecko when Binance fails"""
-        # Binance fails
+        # Binance fails on every endpoint in BINANCE_BASE_URLS
         mock_binance = MagicMock()
         mock_binance.status_code = 400
-        mock_get.return_value = mock_binance
 
         # CoinGecko succeeds
         mock_coingecko = MagicMock()
         mock_coingecko.status_code = 200
-        mock_coingecko.json.return_value = {
+        mock_coingecko.content = json.dumps({
             'bitcoin': {
                 'usd': 50000.0,
                 'usd_24h_change': 2.5
             }
-        }
-        mock_get.side_effect = [mock_binance, mock_coingecko]
+        }).encode()
+        mock_get.side_effect = [mock_binance] * len(BINANCE_BASE_URLS) + [mock_coingecko]
 
         result = _fetch_price('BTC', retries=1)
         
@@ -98,11 +100,28 @@ class TestContextBuilder(unittest.TestCase):
             mock_news.return_value = {'headlines': []}
 
             context_json = build_market_context('BTC')
-            
+
             # Should be valid JSON
             context = json.loads(context_json)
             self.assertIsInstance(context, dict)
 
+    def test_build_market_context_cached(self):
+        """Test that repeated builds within the TTL reuse the cached context"""
+        with patch('src.context_builder._fetch_price') as mock_price, \
+             patch('src.context_builder._fetch_ohlc_data') as mock_ohlc, \
+             patch('src.context_builder._fetch_macro_headlines') as mock_news:
+
+            mock_price.return_value = {'spot': 50000.0, 'usd_24h_change': 2.5, 'source': 'binance'}
+            mock_ohlc.return_value = {'current_price': 50000.0}
+            mock_news.return_value = {'headlines': []}
+
+            first = build_market_context('BTC')
+            second = build_market_context('BTC')
+
+            # Second call should be served from cache without refetching
+            self.assertEqual(first, second)
+            self.assertEqual(mock_price.call_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+"""
+Unit tests for the indicators module
+"""
+
+import unittest
+
+import numpy as np
+
+from src.context_builder import _json_dumps, _json_loads
+from src.indicators import compute_indicators
+
+
+def _synthetic_candles(count: int = 30) -> np.ndarray:
+    """Build an (N, 6) OHLC array with gently oscillating closes."""
+    timestamps = np.arange(count, dtype=np.float64) * 3600.0
+    closes = 50000.0 + 250.0 * np.sin(np.arange(count, dtype=np.float64))
+    opens = closes - 10.0
+    highs = closes + 50.0
+    lows = closes - 50.0
+    volumes = np.full(count, 100.0)
+    return np.column_stack([timestamps, opens, highs, lows, closes, volumes])
+
+
+class TestIndicators(unittest.TestCase):
+    """Test cases for compute_indicators"""
+
+    def test_compute_indicators_structure(self):
+        """Test that all expected indicator fields are populated"""
+        result = compute_indicators(_synthetic_candles(), source='binance')
+
+        self.assertIn('current_price', result)
+        self.assertIn('rsi', result)
+        self.assertIn('moving_averages', result)
+        self.assertIn('trend', result)
+        self.assertIsNotNone(result['rsi'])
+        self.assertEqual(result['source'], 'binance')
+
+    def test_compute_indicators_json_serializable(self):
+        """Test that the payload survives the active JSON backend.
+
+        Regression test: the RSI path returned np.float64 from the
+        no-numba fallback kernel, which orjson rejects. The context
+        builder tests mock _fetch_ohlc_data, so only a real
+        compute_indicators run catches this.
+        """
+        result = compute_indicators(_synthetic_candles(), source='binance')
+
+        payload = _json_dumps(result)
+        self.assertEqual(_json_loads(payload)['rsi'], result['rsi'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,142 @@ import typing
 from genlayer import TreeMap, allow_storage, gl, u32, u64, u8
 
 
+def _find_json_object(text: str) -> typing.Optional[str]:
+    """
+    Locate the first balanced JSON object in text with one linear pass.
+
+    Tracks brace depth while skipping string literals (and their escapes),
+    so unlike a nested-object regex it cannot backtrack on large or deeply
+    nested LLM output. Returns the exact object slice, or None.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}':
+            if depth:
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    return None
+
+# JSON helpers for the prediction hot path: use orjson when the runtime
+# provides it (C-accelerated, emits minified output), otherwise stdlib json.
+# The GenLayer test runtime ships stdlib only, so the fallback is the norm.
+try:
+    import orjson
+
+    def _json_dumps(obj: typing.Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: typing.Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+    _json_loads = json.loads
+
+
+def _norm_symbol(symbol: str) -> str:
+    """Canonical symbol key: stripped, upper-cased only when needed."""
+    s = symbol.strip()
+    return s if s.isupper() else s.upper()
+
+
+def _norm_timeframe(timeframe: str) -> str:
+    """Canonical timeframe key: stripped, lower-cased only when needed."""
+    t = timeframe.strip()
+    return t if t.islower() else t.lower()
+
+
+# Human-readable duration per timeframe, used in prompts and validation
+_TIMEFRAME_DURATIONS = {
+    "1h": "1 hour",
+    "4h": "4 hours",
+    "12h": "12 hours",
+    "24h": "24 hours",
+    "7d": "7 days",
+    "30d": "30 days",
+}
+
+# Valid timeframes: frozenset for O(1) membership checks, list (in the
+# canonical order) for error messages and ordered iteration
+_VALID_TIMEFRAMES = frozenset(_TIMEFRAME_DURATIONS)
+_VALID_TIMEFRAMES_LIST = list(_TIMEFRAME_DURATIONS)
+
+# Accepted outlook values, hashed once at import instead of rebuilding a
+# tuple for every membership test in _build_record
+_VALID_OUTLOOKS = frozenset({"bullish", "bearish", "neutral"})
+
+_GUIDANCE_SHORT = "For this short-term timeframe, focus primarily on technical indicators, momentum, order flow, and immediate market sentiment. Short-term price movements are more influenced by technical patterns, support/resistance levels, and intraday trading activity."
+_GUIDANCE_MEDIUM = "For this medium-term timeframe, balance technical analysis with fundamental factors. Consider both short-term momentum and emerging market trends, news events, and sentiment shifts that could impact price within this window."
+_GUIDANCE_LONG = "For this longer-term timeframe, emphasize fundamental analysis, macroeconomic trends, structural market changes, and major news events. Technical indicators are less reliable over longer periods, so focus on broader market dynamics, adoption trends, and fundamental catalysts."
+
+_TASK_TEMPLATE = """You are an expert market analyst combining technical analysis with fundamental market factors. Use the supplied JSON context to forecast the price of {{symbol}} {duration} from now.
+
+TIMEFRAME GUIDANCE:
+{guidance}
+
+ANALYSIS REQUIREMENTS:
+1. TECHNICAL ANALYSIS: If technical_indicators are provided, analyze RSI, MACD, Moving Averages, Support/Resistance levels, price patterns, and trend direction to identify momentum and potential reversal signals.
+2. FUNDAMENTAL ANALYSIS: Consider market news, macroeconomic trends, sentiment indicators, and on-chain data to understand broader market dynamics.
+3. TREND ANALYSIS: Evaluate current market trends, price action patterns, and how technical signals align with fundamental drivers.
+4. SYNTHESIS: Combine technical indicators with market news, trends, and sentiment to form a comprehensive prediction.
+
+Return ONLY valid JSON with the following keys:
+- predicted_price: string (free-form numeric value and currency, e.g. "43750.25 USD")
+- confidence: integer 0-100
+- outlook: one of ["bullish","bearish","neutral"]
+- summary: short paragraph (<= 240 chars) combining technical signals with market trends and news
+- reasoning: detailed paragraph list (400-900 chars) explaining:
+  * Technical indicators analysis (RSI levels, MACD signals, MA crossovers, support/resistance if available)
+  * Market trends and price action interpretation
+  * Fundamental factors (news impact, sentiment, macro trends)
+  * How technical signals align or conflict with market news and trends
+  * Timeframe-specific considerations (why this prediction is appropriate for {duration})
+- key_events: array of up to 5 short strings describing major drivers (include both technical signals like "RSI oversold", "MACD bullish crossover" AND market events/news)
+- sources: array of up to 5 human-readable references (URLs or descriptors)
+Do not include markdown. JSON must be minified."""
+
+# Per-timeframe tasks fully rendered at import time, leaving only {symbol}
+# to substitute per call — the multi-KB prompt isn't rebuilt per prediction
+_TASK_TEMPLATES = {
+    tf: _TASK_TEMPLATE.format(
+        duration=duration,
+        guidance=(
+            _GUIDANCE_SHORT if tf in ("1h", "4h")
+            else _GUIDANCE_MEDIUM if tf in ("12h", "24h")
+            else _GUIDANCE_LONG
+        ),
+    )
+    for tf, duration in _TIMEFRAME_DURATIONS.items()
+}
+
+_CRITERIA = """
+Output must be strict JSON object.
+confidence must be 0-100.
+outlook must be bullish, bearish, or neutral.
+reasoning must include both technical indicator analysis (if available) AND fundamental factors (news, trends, sentiment).
+key_events should include both technical signals (e.g., "RSI oversold", "MACD bullish crossover", "Price above MA20") and fundamental catalysts (macro news, market trends, sentiment shifts, liquidity events).
+sources should cite URLs or clear identifiers.
+"""
+
+
 @allow_storage
 @dataclass
 class SymbolConfig:
@@ -56,7 +192,7 @@ class MarketPredictionManager(gl.Contract):
                 legacy_counter = self.symbol_counters.get(symbol)
                 if legacy_counter is None:
                     continue
-                tf_key = f"{symbol}-24h"
+                tf_key = symbol + "-24h"
                 if self.symbol_timeframe_counters.get(tf_key) is None:
                     self.symbol_timeframe_counters[tf_key] = legacy_counter
                 legacy_latest = self.symbol_latest_prediction.get(symbol)
@@ -68,26 +204,33 @@ class MarketPredictionManager(gl.Contract):
 
     @gl.public.write
     def add_symbol(self, symbol: str, description: str) -> None:
-        key = symbol.upper().strip()
+        key = _norm_symbol(symbol)
         if len(key) == 0:
             raise ValueError("symbol cannot be empty")
         if key in self.symbols:
             raise ValueError("symbol already exists")
 
         self.symbols[key] = SymbolConfig(description=description, is_active=True)
-        self.symbol_counters[key] = u64(0)
         
         # Initialize timeframe counters for all timeframes (set to 0)
         # This ensures the symbol is ready for predictions across all timeframes
-        valid_timeframes = ["1h", "4h", "12h", "24h", "7d", "30d"]
-        for tf in valid_timeframes:
-            tf_key = f"{key}-{tf}"
+        for tf in _VALID_TIMEFRAMES_LIST:
+            tf_key = key + "-" + tf
             if self.symbol_timeframe_counters.get(tf_key) is None:
                 self.symbol_timeframe_counters[tf_key] = u64(0)
 
+    @gl.public.write
+    def migrate_legacy_state(self) -> None:
+        """
+        One-shot migration: copy any legacy 24h counters/latest pointers into
+        the timeframe-keyed maps. Needed once on contracts deployed before
+        the legacy mirror writes were retired; idempotent otherwise.
+        """
+        self._initialise_timeframe_state()
+
     @gl.public.write
     def update_symbol_status(self, symbol: str, is_active: bool) -> None:
-        key = symbol.upper().strip()
+        key = _norm_symbol(symbol)
         config = self.symbols.get(key)
         if config is None:
             raise ValueError("symbol not registered")
@@ -102,182 +245,141 @@ class MarketPredictionManager(gl.Contract):
 
     @gl.public.write
     def request_update(self, symbol: str, context_json: str, timeframe: str = "24h") -> str:
-        key = symbol.upper().strip()
-        if key not in self.symbols:
+        key = _norm_symbol(symbol)
+        # Single TreeMap traversal: .get covers both the existence check and
+        # the config fetch (membership + index would walk the trie twice)
+        config = self.symbols.get(key)
+        if config is None:
             raise ValueError("symbol not registered")
         if len(context_json.strip()) == 0:
             raise ValueError("context_json required")
 
         # Validate timeframe
-        tf = timeframe.lower().strip()
-        valid_timeframes = ["1h", "4h", "12h", "24h", "7d", "30d"]
-        if tf not in valid_timeframes:
-            raise ValueError(f"invalid timeframe. Must be one of: {valid_timeframes}")
+        tf = _norm_timeframe(timeframe)
+        if tf not in _VALID_TIMEFRAMES:
+            raise ValueError(f"invalid timeframe. Must be one of: {_VALID_TIMEFRAMES_LIST}")
 
-        config = self.symbols[key]
         if not config.is_active:
             raise ValueError("symbol inactive")
 
         payload = self._execute_prediction(key, tf, context_json)
 
-        tf_key = f"{key}-{tf}"
+        tf_key = key + "-" + tf
 
-        if tf == "24h":
-            counter = int(self.symbol_counters.get(key, u64(0)))
-            # Keep timeframe counter in sync but do not treat it as source of truth
-            if self.symbol_timeframe_counters.get(tf_key) is None:
-                self.symbol_timeframe_counters[tf_key] = u64(counter)
-        else:
-            counter = int(self.symbol_timeframe_counters.get(tf_key, u64(0)))
+        # Timeframe counters are the single source of truth; legacy 24h state
+        # is folded in by migrate_legacy_state for pre-upgrade deployments.
+        # Fetching without a boxed u64(0) default avoids constructing a typed
+        # zero per call.
+        stored = self.symbol_timeframe_counters.get(tf_key)
+        counter = 0 if stored is None else int(stored)
 
         next_counter = counter + 1
-        prediction_id = f"{key}-{tf}-{next_counter}"
+        # Box the new counter into the storage type exactly once; the record,
+        # both counter slots, and any future uses share the same object
+        next_counter_u64 = u64(next_counter)
+        prediction_id = tf_key + "-" + str(next_counter)
 
         record = self._build_record(
             prediction_id=prediction_id,
             symbol=key,
             timeframe=tf,
-            counter=u64(next_counter),
+            counter=next_counter_u64,
             payload=payload,
             context_json=context_json,
         )
 
-        # Store in timeframe-specific storage
+        # Grouped commit of the timeframe-specific slots (add_symbol pre-seeds
+        # the counter slots, so these are warm writes, not cold inserts)
         self.predictions[prediction_id] = record
         self.symbol_timeframe_latest[tf_key] = prediction_id
-
-        if tf == "24h":
-            self.symbol_counters[key] = u64(next_counter)
-            self.symbol_latest_prediction[key] = prediction_id
-            self.symbol_timeframe_counters[tf_key] = u64(next_counter)
-        else:
-            self.symbol_timeframe_counters[tf_key] = u64(next_counter)
+        self.symbol_timeframe_counters[tf_key] = next_counter_u64
 
         # History trimming per timeframe
         max_keep = int(self.max_history)
         if max_keep > 0 and next_counter > max_keep:
             remove_index = next_counter - max_keep
             if tf == "24h":
-                remove_id_new = f"{key}-24h-{remove_index}"
+                remove_id_new = tf_key + "-" + str(remove_index)
                 self._delete_prediction_if_exists(remove_id_new)
-                legacy_id = f"{key}-{remove_index}"
+                legacy_id = key + "-" + str(remove_index)
                 self._delete_prediction_if_exists(legacy_id)
             else:
-                remove_id = f"{key}-{tf}-{remove_index}"
+                remove_id = tf_key + "-" + str(remove_index)
                 self._delete_prediction_if_exists(remove_id)
 
         return prediction_id
 
     def _execute_prediction(self, symbol: str, timeframe: str, context_json: str) -> typing.Dict[str, typing.Any]:
-        # Map timeframe to human-readable duration
-        timeframe_map = {
-            "1h": "1 hour",
-            "4h": "4 hours",
-            "12h": "12 hours",
-            "24h": "24 hours",
-            "7d": "7 days",
-            "30d": "30 days"
-        }
-        duration = timeframe_map.get(timeframe, "24 hours")
-        
-        # Adjust analysis focus based on timeframe
-        if timeframe in ["1h", "4h"]:
-            timeframe_guidance = "For this short-term timeframe, focus primarily on technical indicators, momentum, order flow, and immediate market sentiment. Short-term price movements are more influenced by technical patterns, support/resistance levels, and intraday trading activity."
-        elif timeframe in ["12h", "24h"]:
-            timeframe_guidance = "For this medium-term timeframe, balance technical analysis with fundamental factors. Consider both short-term momentum and emerging market trends, news events, and sentiment shifts that could impact price within this window."
-        else:  # 7d, 30d
-            timeframe_guidance = "For this longer-term timeframe, emphasize fundamental analysis, macroeconomic trends, structural market changes, and major news events. Technical indicators are less reliable over longer periods, so focus on broader market dynamics, adoption trends, and fundamental catalysts."
-        
-        task = f"""You are an expert market analyst combining technical analysis with fundamental market factors. Use the supplied JSON context to forecast the price of {symbol} {duration} from now.
-
-TIMEFRAME GUIDANCE:
-{timeframe_guidance}
-
-ANALYSIS REQUIREMENTS:
-1. TECHNICAL ANALYSIS: If technical_indicators are provided, analyze RSI, MACD, Moving Averages, Support/Resistance levels, price patterns, and trend direction to identify momentum and potential reversal signals.
-2. FUNDAMENTAL ANALYSIS: Consider market news, macroeconomic trends, sentiment indicators, and on-chain data to understand broader market dynamics.
-3. TREND ANALYSIS: Evaluate current market trends, price action patterns, and how technical signals align with fundamental drivers.
-4. SYNTHESIS: Combine technical indicators with market news, trends, and sentiment to form a comprehensive prediction.
-
-Return ONLY valid JSON with the following keys:
-- predicted_price: string (free-form numeric value and currency, e.g. "43750.25 USD")
-- confidence: integer 0-100
-- outlook: one of ["bullish","bearish","neutral"]
-- summary: short paragraph (<= 240 chars) combining technical signals with market trends and news
-- reasoning: detailed paragraph list (400-900 chars) explaining:
-  * Technical indicators analysis (RSI levels, MACD signals, MA crossovers, support/resistance if available)
-  * Market trends and price action interpretation
-  * Fundamental factors (news impact, sentiment, macro trends)
-  * How technical signals align or conflict with market news and trends
-  * Timeframe-specific considerations (why this prediction is appropriate for {duration})
-- key_events: array of up to 5 short strings describing major drivers (include both technical signals like "RSI oversold", "MACD bullish crossover" AND market events/news)
-- sources: array of up to 5 human-readable references (URLs or descriptors)
-Do not include markdown. JSON must be minified."""
-
-        criteria = """
-Output must be strict JSON object.
-confidence must be 0-100.
-outlook must be bullish, bearish, or neutral.
-reasoning must include both technical indicator analysis (if available) AND fundamental factors (news, trends, sentiment).
-key_events should include both technical signals (e.g., "RSI oversold", "MACD bullish crossover", "Price above MA20") and fundamental catalysts (macro news, market trends, sentiment shifts, liquidity events).
-sources should cite URLs or clear identifiers.
-"""
+        # Prompts are pre-rendered per timeframe at module scope; only the
+        # symbol is substituted here
+        template = _TASK_TEMPLATES.get(timeframe) or _TASK_TEMPLATES["24h"]
+        task = template.format(symbol=symbol)
 
         def provide_context():
             return context_json
 
-        result = gl.eq_principle.prompt_non_comparative(provide_context, task=task, criteria=criteria)
+        result = gl.eq_principle.prompt_non_comparative(provide_context, task=task, criteria=_CRITERIA)
 
         # Clean the result - remove any trailing whitespace, newlines, or extra characters
         cleaned = result.strip()
         
-        # If result is a quoted JSON string, unquote it first
-        if cleaned.startswith('"') and cleaned.endswith('"'):
+        # If result is a quoted JSON string, unquote it first. Only bother
+        # when the payload actually looks like an object wrapped in quotes
+        # ('"{' or '"\\' after escaping) — plain JSON objects, the common
+        # case, skip this parse entirely and go straight to the main loads.
+        if (
+            len(cleaned) > 2
+            and cleaned[0] == '"'
+            and cleaned[-1] == '"'
+            and cleaned[1] in ('{', '\\')
+        ):
             try:
-                cleaned = json.loads(cleaned)  # Unwrap quoted JSON string
-                if isinstance(cleaned, str):
-                    cleaned = cleaned.strip()
-                else:
-                    # If it's already parsed, re-serialize
-                    cleaned = json.dumps(cleaned, separators=(',', ':'))
-            except:
+                unwrapped = _json_loads(cleaned)
+            except Exception:
                 # If unquoting fails, remove quotes manually
-                if len(cleaned) > 2:
-                    cleaned = cleaned[1:-1]
-        
-        # Remove trailing newlines and extra closing braces
-        cleaned = cleaned.rstrip()
-        # Remove trailing }\n} pattern
-        while cleaned.endswith('\n}') or (cleaned.endswith('}') and cleaned.count('}') > cleaned.count('{')):
-            # Find the last complete JSON object
-            last_brace = cleaned.rfind('}')
-            if last_brace > 0:
-                test_json = cleaned[:last_brace + 1]
-                try:
-                    json.loads(test_json)
-                    cleaned = test_json
-                    break
-                except:
-                    cleaned = cleaned[:last_brace].rstrip()
+                cleaned = cleaned[1:-1]
             else:
-                break
+                if isinstance(unwrapped, str):
+                    cleaned = unwrapped.strip()
+                # A non-string result means the outer quotes were part of the
+                # payload after all; leave cleaned as-is for the main parse
+                # rather than re-serializing the already-parsed value
         
+        # Remove trailing newlines; stray trailing braces are handled by the
+        # parse-then-scan fallback below, which slices out the first balanced
+        # object in one linear pass instead of repeatedly re-counting braces
+        cleaned = cleaned.rstrip()
+
         # Try to parse the cleaned JSON
         try:
-            parsed = json.loads(cleaned)
+            parsed = _json_loads(cleaned)
         except Exception as exc:
             # Try to find JSON object in the string if it's embedded
-            import re
-            # More robust regex to find JSON object
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', cleaned, re.DOTALL)
-            if json_match:
+            candidate = _find_json_object(cleaned)
+            if candidate is not None:
                 try:
-                    parsed = json.loads(json_match.group(0))
+                    parsed = _json_loads(candidate)
                 except:
                     raise ValueError(f"prediction JSON parse error: {exc}. Raw result (first 500 chars): {result[:500]}")
             else:
                 raise ValueError(f"prediction JSON parse error: {exc}. Raw result (first 500 chars): {result[:500]}")
 
+        # A quote-wrapped payload whose inner text starts with anything other
+        # than '{' or an escape slips past the unwrap guard above and parses
+        # cleanly to a str; salvage it with the same parse-then-scan pass on
+        # the unwrapped text before rejecting the (paid) transaction
+        if isinstance(parsed, str):
+            inner = parsed.strip()
+            try:
+                parsed = _json_loads(inner)
+            except Exception:
+                candidate = _find_json_object(inner)
+                if candidate is not None:
+                    try:
+                        parsed = _json_loads(candidate)
+                    except Exception:
+                        pass
+
         if not isinstance(parsed, dict):
             raise ValueError("prediction must be JSON object")
         return parsed
@@ -295,38 +397,54 @@ sources should cite URLs or clear identifiers.
         if len(predicted_price) == 0:
             raise ValueError("predicted_price missing")
 
+        # Confidence arrives as a JSON int in the well-formed case; only fall
+        # back to the int() coercion for strings/floats the model sneaks in
         raw_confidence = payload.get("confidence", 0)
-        try:
-            confidence_int = int(raw_confidence)
-        except Exception as exc:
-            raise ValueError(f"invalid confidence value: {exc}")
-        if confidence_int < 0:
-            confidence_int = 0
-        if confidence_int > 100:
-            confidence_int = 100
-
-        outlook = str(payload.get("outlook", "neutral")).lower()
-        if outlook not in ("bullish", "bearish", "neutral"):
-            outlook = "neutral"
-
-        summary = str(payload.get("summary", ""))[:512]
-        reasoning = str(payload.get("reasoning", ""))[:2048]
-
+        if type(raw_confidence) is int:
+            confidence_int = raw_confidence
+        else:
+            try:
+                confidence_int = int(raw_confidence)
+            except Exception as exc:
+                raise ValueError(f"invalid confidence value: {exc}")
+        confidence_int = max(0, min(100, confidence_int))
+
+        outlook = payload.get("outlook", "neutral")
+        if type(outlook) is not str:
+            outlook = str(outlook)
+        if outlook not in _VALID_OUTLOOKS:
+            outlook = outlook.lower()
+            if outlook not in _VALID_OUTLOOKS:
+                outlook = "neutral"
+
+        summary = payload.get("summary", "")
+        if type(summary) is not str:
+            summary = str(summary)
+        if len(summary) > 512:
+            summary = summary[:512]
+
+        reasoning = payload.get("reasoning", "")
+        if type(reasoning) is not str:
+            reasoning = str(reasoning)
+        if len(reasoning) > 2048:
+            reasoning = reasoning[:2048]
+
+        # One comprehension feeding one serialize per field; slicing a str
+        # already under the cap returns the same object, so no per-item
+        # length guard is needed
         events = payload.get("key_events", [])
-        key_events_json = "[]"
-        if isinstance(events, list):
-            trimmed_events = []
-            for item in events[:5]:
-                trimmed_events.append(str(item)[:160])
-            key_events_json = json.dumps(trimmed_events)
+        key_events_json = (
+            _json_dumps([str(item)[:160] for item in events[:5]])
+            if isinstance(events, list)
+            else "[]"
+        )
 
         sources = payload.get("sources", [])
-        sources_json = "[]"
-        if isinstance(sources, list):
-            trimmed_sources = []
-            for item in sources[:5]:
-                trimmed_sources.append(str(item)[:256])
-            sources_json = json.dumps(trimmed_sources)
+        sources_json = (
+            _json_dumps([str(item)[:256] for item in sources[:5]])
+            if isinstance(sources, list)
+            else "[]"
+        )
 
         return PredictionRecord(
             prediction_id=prediction_id,
@@ -345,20 +463,28 @@ sources should cite URLs or clear identifiers.
 
     @gl.public.view
     def get_symbol_config(self, symbol: str) -> TreeMap[str, str]:
-        key = symbol.upper().strip()
+        key = _norm_symbol(symbol)
         config = self.symbols.get(key)
         if config is None:
             raise ValueError("symbol not registered")
 
-        counter = int(self.symbol_counters.get(key, u64(0)))
-        latest = self.symbol_latest_prediction.get(key, "")
+        # Legacy state is read-only now: derive the 24h figures from the
+        # timeframe slots that request_update actually maintains
+        tf_key = key + "-24h"
+        stored = self.symbol_timeframe_counters.get(tf_key)
+        counter = 0 if stored is None else int(stored)
+        latest = self.symbol_timeframe_latest.get(tf_key, "")
 
+        # Same bound-setter trick as _record_to_map: one __setitem__ lookup
+        # for the five fixed keys (the storage API has no way to clone a
+        # pre-built map skeleton)
         info = gl.storage.inmem_allocate(TreeMap[str, str])
-        info["symbol"] = key
-        info["description"] = config.description
-        info["is_active"] = "true" if config.is_active else "false"
-        info["total_updates"] = str(counter)
-        info["latest_prediction_id"] = latest
+        put = info.__setitem__
+        put("symbol", key)
+        put("description", config.description)
+        put("is_active", "true" if config.is_active else "false")
+        put("total_updates", str(counter))
+        put("latest_prediction_id", latest)
         return info
 
     @gl.public.view
@@ -370,8 +496,8 @@ sources should cite URLs or clear identifiers.
 
     @gl.public.view
     def get_latest_prediction(self, symbol: str) -> TreeMap[str, str]:
-        key = symbol.upper().strip()
-        prediction_id = self.symbol_latest_prediction.get(key)
+        key = _norm_symbol(symbol)
+        prediction_id = self.symbol_timeframe_latest.get(key + "-24h")
         if prediction_id is None:
             raise ValueError("no predictions recorded")
         record = self.predictions.get(prediction_id)
@@ -403,54 +529,62 @@ sources should cite URLs or clear identifiers.
         if limit <= 0:
             raise ValueError("limit must be positive")
 
-        key = symbol.upper().strip()
-        tf = timeframe.lower().strip()
+        key = _norm_symbol(symbol)
+        tf = _norm_timeframe(timeframe)
         
         # Validate timeframe
-        valid_timeframes = ["1h", "4h", "12h", "24h", "7d", "30d"]
-        if tf not in valid_timeframes:
-            raise ValueError(f"invalid timeframe. Must be one of: {valid_timeframes}")
+        if tf not in _VALID_TIMEFRAMES:
+            raise ValueError(f"invalid timeframe. Must be one of: {_VALID_TIMEFRAMES_LIST}")
         
-        tf_key = f"{key}-{tf}"
+        tf_key = key + "-" + tf
         counter = int(self.symbol_timeframe_counters.get(tf_key, u64(0)))
         
         if counter == 0:
             raise ValueError(f"no predictions recorded for {symbol} {timeframe}")
 
-        max_entries = min(limit, counter, int(self.max_history) if int(self.max_history) > 0 else limit)
+        max_keep = int(self.max_history)
+        max_entries = min(limit, counter, max_keep if max_keep > 0 else limit)
+
+        # Trimming in request_update keeps the live ids contiguous in
+        # [counter - max_keep + 1, counter], so never walk below that floor:
+        # every lookup there is a guaranteed miss
+        floor = max(1, counter - max_keep + 1) if max_keep > 0 else 1
+        stop = max(floor - 1, counter - max_entries)
 
         history: typing.List[TreeMap[str, str]] = []
-        current = counter
-        collected = 0
 
-        while current >= 1 and collected < max_entries:
-            prediction_id = f"{key}-{tf}-{current}"
-            record = self.predictions.get(prediction_id)
-            
+        # The TreeMap API offers point lookups only (no ordered range scan),
+        # so the reverse walk stays; hoisting the id prefixes at least keeps
+        # the per-iteration work to one concatenation instead of a full
+        # f-string format
+        id_prefix = tf_key + "-"
+        legacy_prefix = key + "-"
+
+        for current in range(counter, stop, -1):
+            record = self.predictions.get(id_prefix + str(current))
+
             # For 24h timeframe, also check legacy format for backward compatibility
             if record is None and tf == "24h":
-                legacy_id = f"{key}-{current}"
-                record = self.predictions.get(legacy_id)
-            
+                record = self.predictions.get(legacy_prefix + str(current))
+
+            # The None guard stays: raising max_history after trimming can
+            # leave misses inside the nominal window
             if record is not None:
                 history.append(self._record_to_map(record))
-                collected += 1
-            current -= 1
 
         return history
 
     @gl.public.view
     def get_latest_prediction_by_timeframe(self, symbol: str, timeframe: str) -> TreeMap[str, str]:
         """Get latest prediction for a specific symbol and timeframe"""
-        key = symbol.upper().strip()
-        tf = timeframe.lower().strip()
+        key = _norm_symbol(symbol)
+        tf = _norm_timeframe(timeframe)
         
         # Validate timeframe
-        valid_timeframes = ["1h", "4h", "12h", "24h", "7d", "30d"]
-        if tf not in valid_timeframes:
-            raise ValueError(f"invalid timeframe. Must be one of: {valid_timeframes}")
+        if tf not in _VALID_TIMEFRAMES:
+            raise ValueError(f"invalid timeframe. Must be one of: {_VALID_TIMEFRAMES_LIST}")
         
-        tf_key = f"{key}-{tf}"
+        tf_key = key + "-" + tf
         prediction_id = self.symbol_timeframe_latest.get(tf_key)
         if prediction_id is None:
             raise ValueError(f"no predictions recorded for {symbol} {timeframe}")
@@ -463,33 +597,45 @@ sources should cite URLs or clear identifiers.
     @gl.public.view
     def get_all_timeframe_predictions(self, symbol: str) -> TreeMap[str, TreeMap[str, str]]:
         """Get latest prediction for all timeframes of a symbol"""
-        key = symbol.upper().strip()
+        key = _norm_symbol(symbol)
         result = gl.storage.inmem_allocate(TreeMap[str, TreeMap[str, str]])
-        
-        for tf in ["1h", "4h", "12h", "24h", "7d", "30d"]:
-            tf_key = f"{key}-{tf}"
-            prediction_id = self.symbol_timeframe_latest.get(tf_key)
+
+        # The TreeMap has no range scan or multi-get, so batch in two phases
+        # instead: gather the six latest-pointer slots first, then fetch the
+        # records in sorted id order so consecutive lookups walk adjacent
+        # keys in the trie
+        prefix = key + "-"
+        pending: typing.List[typing.Tuple[str, str]] = []
+        for tf in _VALID_TIMEFRAMES_LIST:
+            prediction_id = self.symbol_timeframe_latest.get(prefix + tf)
             if prediction_id:
-                record = self.predictions.get(prediction_id)
-                if record:
-                    result[tf] = self._record_to_map(record)
-        
+                pending.append((prediction_id, tf))
+
+        for prediction_id, tf in sorted(pending):
+            record = self.predictions.get(prediction_id)
+            if record:
+                result[tf] = self._record_to_map(record)
+
         return result
 
     def _record_to_map(self, record: PredictionRecord) -> TreeMap[str, str]:
         data = gl.storage.inmem_allocate(TreeMap[str, str])
-        data["prediction_id"] = record.prediction_id
-        data["symbol"] = record.symbol
-        data["timeframe"] = record.timeframe
-        data["counter"] = str(int(record.counter))
-        data["predicted_price"] = record.predicted_price
-        data["outlook"] = record.outlook
-        data["confidence"] = str(int(record.confidence))
-        data["summary"] = record.summary
-        data["reasoning"] = record.reasoning
-        data["key_events_json"] = record.key_events_json
-        data["sources_json"] = record.sources_json
-        data["raw_context"] = record.raw_context
+        # Bind the item-setter once: the history views call this in a loop,
+        # and twelve per-record __setitem__ attribute lookups add up (the
+        # TreeMap offers no bulk construction from pairs)
+        put = data.__setitem__
+        put("prediction_id", record.prediction_id)
+        put("symbol", record.symbol)
+        put("timeframe", record.timeframe)
+        put("counter", str(int(record.counter)))
+        put("predicted_price", record.predicted_price)
+        put("outlook", record.outlook)
+        put("confidence", str(int(record.confidence)))
+        put("summary", record.summary)
+        put("reasoning", record.reasoning)
+        put("key_events_json", record.key_events_json)
+        put("sources_json", record.sources_json)
+        put("raw_context", record.raw_context)
         return data
 
     def _delete_prediction_if_exists(self, prediction_id: str) -> None: